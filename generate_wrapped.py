@@ -2,11 +2,14 @@ import sys
 import os
 import math
 import random
+import functools
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Tuple, Optional, Set
 
-from PIL import Image, ImageDraw, ImageFont, ImageChops
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageChops, ImageColor
 
 # --- CONFIGURATION ---
 
@@ -57,9 +60,16 @@ class AssetManager:
         "/usr/share/fonts/noto/NotoSans-Regular.ttf",
     ]
     
-    _font_cache = {}  # Cache loaded fonts to avoid repeated file access
     _base_path_cache = None  # Cache the resolved base path
 
+    # (size, weight) pairs used by the card renderers, loaded up front by warm_fonts()
+    _common_font_sizes = [
+        (500, 'black'), (300, 'black'), (290, 'black'), (100, 'black'), (90, 'black'),
+        (80, 'black'), (60, 'black'), (55, 'black'), (50, 'black'), (45, 'black'), (40, 'black'),
+        (50, 'bold'), (40, 'bold'), (50, 'medium'), (40, 'medium'),
+        (50, 'book'), (45, 'book'), (40, 'book'), (35, 'book'),
+    ]
+
     @staticmethod
     def get_base_path():
         """
@@ -110,28 +120,20 @@ class AssetManager:
         return os.path.join(cls.get_base_path(), "fonts", "Spotify-Circular-Font", filename)
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _get_fallback_font(cls, size: int) -> ImageFont.FreeTypeFont:
         """Try to load a system TrueType font as fallback (Linux-friendly)."""
-        # Check cache first
-        cache_key = ('fallback', size)
-        if cache_key in cls._font_cache:
-            return cls._font_cache[cache_key]
-        
         # Try Linux system fonts
         for font_path in cls._linux_fallback_fonts:
             if os.path.exists(font_path):
                 try:
-                    font = ImageFont.truetype(font_path, size)
-                    cls._font_cache[cache_key] = font
-                    return font
+                    return ImageFont.truetype(font_path, size)
                 except Exception:
                     continue
         
         # Try Pillow 10.0+ default (returns TrueType font)
         try:
-            font = ImageFont.load_default(size=size)
-            cls._font_cache[cache_key] = font
-            return font
+            return ImageFont.load_default(size=size)
         except TypeError:
             # Older Pillow doesn't support size parameter
             pass
@@ -142,22 +144,29 @@ class AssetManager:
 
     @classmethod
     def get_font(cls, size: int, weight: str = 'book') -> ImageFont.FreeTypeFont:
-        # Check cache first
-        cache_key = (weight, size)
-        if cache_key in cls._font_cache:
-            return cls._font_cache[cache_key]
-        
+        return cls._load_font(size, weight)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _load_font(cls, size: int, weight: str) -> ImageFont.FreeTypeFont:
+        # Memoized so each (size, weight) face is parsed from disk only once
         try:
             path = cls.get_font_path(weight)
-            font = ImageFont.truetype(path, size)
-            cls._font_cache[cache_key] = font
-            return font
+            return ImageFont.truetype(path, size)
         except OSError as e:
             logging.warning(f"Font not found at {path}: {e}")
             return cls._get_fallback_font(size)
 
     @classmethod
+    def warm_fonts(cls):
+        """Pre-loads the (size, weight) pairs used by the card renderers."""
+        for size, weight in cls._common_font_sizes:
+            cls.get_font(size, weight)
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_icon(cls, is_light_theme: bool) -> Image.Image:
+        # Cached per theme; callers must not mutate the returned image
         filename = "spo_icon_dark.png" if is_light_theme else "spo_icon_light.png"
         path = os.path.join(cls.get_base_path(), filename)
         if os.path.exists(path):
@@ -165,18 +174,36 @@ class AssetManager:
         logging.warning(f"Icon not found at {path}")
         return None
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def get_footer_logo(cls, is_light_theme: bool) -> Optional[Image.Image]:
+        """The theme icon pre-sized for the card footer."""
+        logo = cls.get_icon(is_light_theme)
+        return logo.resize((105, 105), Image.Resampling.BILINEAR) if logo else None
+
+AssetManager.warm_fonts()
+
 # --- DRAWING UTILITIES ---
 
+# Shared context for text metrics; only ever queried, never drawn on
+_DUMMY_DRAW = ImageDraw.Draw(Image.new("L", (1, 1)))
+
 class DrawUtils:
     @staticmethod
     def _safe_textlength(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.FreeTypeFont) -> float:
-        """Safely get text length, with fallback for bitmap fonts."""
+        """Safely get text length, with fallback for bitmap fonts. Cached per (text, font)."""
+        # Advance width depends only on the font and text, not on the image being drawn to
+        return DrawUtils._measure_text(text, font)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _measure_text(text: str, font: ImageFont.FreeTypeFont) -> float:
         try:
-            return draw.textlength(text, font)
+            return _DUMMY_DRAW.textlength(text, font)
         except AttributeError:
             # Fallback for bitmap fonts that don't support textlength
             try:
-                bbox = draw.textbbox((0, 0), text, font=font)
+                bbox = _DUMMY_DRAW.textbbox((0, 0), text, font=font)
                 return bbox[2] - bbox[0]
             except Exception:
                 # Last resort: estimate based on character count
@@ -210,9 +237,84 @@ class DrawUtils:
             return text
         ellipsis = "..."
         target = max_width - DrawUtils._safe_textlength(draw, ellipsis, font)
-        while len(text) > 0 and DrawUtils._safe_textlength(draw, text, font) > target:
-            text = text[:-1]
-        return text + ellipsis
+        # Prefix width grows with length, so binary search for the longest prefix that fits
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if DrawUtils._safe_textlength(draw, text[:mid], font) <= target:
+                lo = mid
+            else:
+                hi = mid - 1
+        return text[:lo] + ellipsis
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _char_advances(text: str, font: ImageFont.FreeTypeFont) -> Tuple[float, ...]:
+        """Per-character advance widths, measured once per (text, font)."""
+        return tuple(DrawUtils._measure_text(char, font) for char in text)
+
+    @staticmethod
+    def _render_text_layer(text: str, font: ImageFont.FreeTypeFont, fill: Any, kerning: int = 0,
+                           stroke_width: int = 0, stroke_fill: Any = None) -> Tuple[Image.Image, float, int]:
+        """
+        Renders text onto a transparent layer sized to fit it. Returns the layer and its raw width/height.
+        Kerned text without a stroke is rasterized glyph by glyph into a single-channel mask, then colored in one paste.
+        """
+        # Calculate Dimensions
+        if kerning == 0:
+            w_raw = DrawUtils._safe_textlength(_DUMMY_DRAW, text, font)
+        else:
+            advances = DrawUtils._char_advances(text, font)
+            w_raw = sum(advances) + kerning * len(text)
+            w_raw = max(1, w_raw - kerning if w_raw > 0 else 1)
+
+        bbox = DrawUtils._safe_textbbox(_DUMMY_DRAW, (0, 0), text, font, stroke_width=stroke_width)
+        h_raw = bbox[3] - bbox[1] + 20 
+        size = (max(1, int(w_raw)), max(1, h_raw))
+        txt_layer = Image.new("RGBA", size, (0, 0, 0, 0))
+
+        if kerning == 0:
+            d = ImageDraw.Draw(txt_layer)
+            try:
+                d.text((0, 0), text, font=font, fill=fill, stroke_width=stroke_width, stroke_fill=stroke_fill)
+            except TypeError:
+                # Fallback for fonts that don't support stroke
+                d.text((0, 0), text, font=font, fill=fill)
+            return txt_layer, w_raw, h_raw
+
+        if stroke_width:
+            # Where negative kerning overlaps glyphs, each stroke must land on top of the previous glyph's fill,
+            # so stroked text keeps per-glyph stroke-then-fill compositing
+            d = ImageDraw.Draw(txt_layer)
+            try:
+                cx = 0
+                for char, advance in zip(text, advances):
+                    d.text((cx, 0), char, font=font, fill=fill, stroke_width=stroke_width, stroke_fill=stroke_fill)
+                    cx += advance + kerning
+                return txt_layer, w_raw, h_raw
+            except TypeError:
+                # Fallback for fonts that don't support stroke
+                pass
+
+        mask = Image.new("L", size, 0)
+        dm = ImageDraw.Draw(mask)
+        cx = 0
+        for char, advance in zip(text, advances):
+            dm.text((cx, 0), char, font=font, fill=255)
+            cx += advance + kerning
+        txt_layer.paste(fill, (0, 0), mask)
+        return txt_layer, w_raw, h_raw
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _render_stretched(text: str, font: ImageFont.FreeTypeFont, fill: Any, stretch_factor: float,
+                          stroke_width: int, stroke_fill: Any, force_width: Optional[int],
+                          kerning: int) -> Tuple[Image.Image, int, int]:
+        """Renders and stretches a text layer. Cached, so callers must only paste the result."""
+        txt_layer, w_raw, h_raw = DrawUtils._render_text_layer(text, font, fill, kerning, stroke_width, stroke_fill)
+        new_w = force_width if force_width else max(1, int(w_raw * stretch_factor))
+        stretched = txt_layer.resize((int(new_w), max(1, h_raw)), resample=Image.Resampling.BILINEAR)
+        return stretched, new_w, h_raw
 
     @staticmethod
     def draw_flat_text(target_img: Image.Image, xy: Tuple[int, int], text: str, 
@@ -235,49 +337,10 @@ class DrawUtils:
             return bbox[2]-bbox[0], bbox[3]-bbox[1]
 
         # Path 2: Custom Text (Stretched/Tightened)
-        dummy = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
-        
-        # Calculate Dimensions
-        if kerning == 0:
-            w_raw = DrawUtils._safe_textlength(dummy, text, font)
-        else:
-            w_raw = 0
-            char_widths = []
-            for char in text:
-                cw = DrawUtils._safe_textlength(dummy, char, font)
-                char_widths.append(cw)
-                w_raw += cw + kerning
-            w_raw = max(1, w_raw - kerning if w_raw > 0 else 1)
-
-        bbox = DrawUtils._safe_textbbox(dummy, (0, 0), text, font, stroke_width=stroke_width)
-        h_raw = bbox[3] - bbox[1] + 20 
-
-        # Render Layer
-        txt_layer = Image.new("RGBA", (max(1, int(w_raw)), max(1, h_raw)), (0, 0, 0, 0))
-        d = ImageDraw.Draw(txt_layer)
-        
-        try:
-            if kerning == 0:
-                d.text((0, 0), text, font=font, fill=fill, stroke_width=stroke_width, stroke_fill=stroke_fill)
-            else:
-                cx = 0
-                for i, char in enumerate(text):
-                    d.text((cx, 0), char, font=font, fill=fill, stroke_width=stroke_width, stroke_fill=stroke_fill)
-                    cx += char_widths[i] + kerning
-        except TypeError:
-            # Fallback for fonts that don't support stroke
-            if kerning == 0:
-                d.text((0, 0), text, font=font, fill=fill)
-            else:
-                cx = 0
-                for i, char in enumerate(text):
-                    d.text((cx, 0), char, font=font, fill=fill)
-                    cx += char_widths[i] + kerning
-
-        # Stretch & Paste
-        new_w = force_width if force_width else max(1, int(w_raw * stretch_factor))
-        stretched = txt_layer.resize((int(new_w), max(1, h_raw)), resample=Image.BICUBIC)
+        stretched, new_w, h_raw = DrawUtils._render_stretched(text, font, fill, stretch_factor, stroke_width,
+                                                              stroke_fill, force_width, kerning)
 
+        # Paste
         x, y = xy
         if anchor:
             if "m" in anchor[0]: x -= new_w // 2
@@ -290,19 +353,37 @@ class DrawUtils:
 
 # --- PATTERN GENERATORS ---
 
+def _cached_pattern(func):
+    """Memoizes a pattern generator. Patterns are static, so callers share one image and must not mutate it."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in PatternGenerator._pattern_cache:
+            PatternGenerator._pattern_cache[key] = func(*args, **kwargs)
+        return PatternGenerator._pattern_cache[key]
+    return wrapper
+
 class PatternGenerator:
+    _pattern_cache: Dict[Tuple, Image.Image] = {}  # Rendered patterns keyed by generator name and arguments
+
+    @staticmethod
+    def _two_tone(mask: np.ndarray, on_color: str, off_color: str) -> Image.Image:
+        """Builds an RGB image from a boolean mask, painting on_color where it is set."""
+        img = Image.new("RGB", (mask.shape[1], mask.shape[0]), off_color)
+        img.paste(on_color, (0, 0), Image.fromarray(mask))
+        return img
+
     @staticmethod
     def _apply_wave(img: Image.Image, amp=30, freq=0.01) -> Image.Image:
-        out = Image.new("RGB", img.size, (255, 255, 255))
-        pix_in, pix_out = img.load(), out.load()
-        w, h = img.size
-        for y in range(h):
-            shift = int(amp * math.sin(y * freq))
-            for x in range(w):
-                pix_out[x, y] = pix_in[(x - shift) % w, y]
-        return out
+        arr = np.asarray(img.convert("RGB"))
+        h, w = arr.shape[:2]
+        # Shift each row horizontally by a sine offset, wrapping around the edges
+        shifts = (amp * np.sin(np.arange(h) * freq)).astype(np.int32)
+        cols = (np.arange(w, dtype=np.int32)[None, :] - shifts[:, None]) % w
+        return Image.fromarray(arr[np.arange(h)[:, None], cols])
 
     @staticmethod
+    @_cached_pattern
     def weezer() -> Image.Image:
         img = Image.new("RGB", PATTERN_SIZE, Colors.DARK_BG)
         draw = ImageDraw.Draw(img)
@@ -314,101 +395,124 @@ class PatternGenerator:
         return img
 
     @staticmethod
+    @_cached_pattern
     def paramore() -> Image.Image:
-        img = Image.new("RGB", PATTERN_SIZE, Colors.DARK_BG)
-        draw = ImageDraw.Draw(img)
         cols, rows, r = 5, 6, 40
         sp_x, sp_y = (PATTERN_SIZE[0]-2*r)/(cols-1), (PATTERN_SIZE[1]-2*r)/(rows-1)
-        for row in range(rows):
-            y = r + row * sp_y
-            for col in range(cols):
-                draw.ellipse([r+col*sp_x-r, y-r, r+col*sp_x+r, y+r], fill=Colors.LIGHT_BG)
-            if row < rows - 1:
-                for ci in range(cols - 1):
-                    xi, yi = r + ci*sp_x + sp_x/2, y + sp_y/2
-                    draw.ellipse([xi-r, yi-r, xi+r, yi+r], fill=Colors.LIGHT_BG)
+        # Main grid of dots plus an offset dot in the middle of each grid cell
+        centers = [(r + col*sp_x, r + row*sp_y) for row in range(rows) for col in range(cols)]
+        centers += [(r + ci*sp_x + sp_x/2, r + row*sp_y + sp_y/2) for row in range(rows - 1) for ci in range(cols - 1)]
+
+        w, h = PATTERN_SIZE
+        yy, xx = np.ogrid[:h, :w]
+        mask = np.zeros((h, w), dtype=bool)
+        for cx, cy in centers:
+            # Only test the pixels inside each dot's bounding box
+            x0, x1 = max(0, int(cx - r)), min(w, int(cx + r) + 1)
+            y0, y1 = max(0, int(cy - r)), min(h, int(cy + r) + 1)
+            mask[y0:y1, x0:x1] |= (xx[:, x0:x1] - cx)**2 + (yy[y0:y1] - cy)**2 <= r*r
+        img = Image.new("RGB", PATTERN_SIZE, Colors.DARK_BG)
+        img.paste(Colors.LIGHT_BG, (0, 0), Image.fromarray(mask))
         return img
 
     @staticmethod
+    @_cached_pattern
     def sabrina() -> Image.Image:
-        img = Image.new("RGB", PATTERN_SIZE, Colors.LIGHT_BG)
-        draw = ImageDraw.Draw(img)
-        cx, cy, curr_r = 860, PATTERN_SIZE[1] // 2, 1000
-        is_blk = True
-        while curr_r > 0:
-            fill = Colors.DARK_BG if is_blk else Colors.LIGHT_BG
-            draw.ellipse([cx-curr_r, cy-curr_r, cx+curr_r, cy+curr_r], fill=fill)
-            curr_r -= 1000/24
-            is_blk = not is_blk
-        return img
+        cx, cy, radius, rings = 860, PATTERN_SIZE[1] // 2, 1000, 24
+        yy, xx = np.mgrid[:PATTERN_SIZE[1], :PATTERN_SIZE[0]].astype(np.float32)
+        dist = np.hypot(xx - cx, yy - cy)
+        # Rings alternate from dark at the outer edge inwards
+        ring = (dist * rings / radius).astype(np.int32)
+        dark = (ring % 2 == 1) & (dist < radius)
+        pixels = np.where(dark[..., None], ImageColor.getrgb(Colors.DARK_BG), ImageColor.getrgb(Colors.LIGHT_BG))
+        return Image.fromarray(pixels.astype(np.uint8))
 
     @staticmethod
+    @_cached_pattern
     def jessie() -> Image.Image:
-        base = Image.new("RGB", PATTERN_SIZE, Colors.LIGHT_BG)
-        draw = ImageDraw.Draw(base)
         sz = 100
-        for r in range(PATTERN_SIZE[1]//sz+2):
-            for c in range(PATTERN_SIZE[0]//sz+2):
-                if (r+c) % 2 == 1:
-                    draw.rectangle([c*sz, r*sz, c*sz+sz, r*sz+sz], fill=Colors.DARK_BG)
+        yy, xx = np.indices((PATTERN_SIZE[1], PATTERN_SIZE[0]))
+        # Checkerboard; grid lines stay dark to match PIL's edge-inclusive rectangles
+        dark = ((yy // sz + xx // sz) % 2 == 1) | ((xx % sz == 0) & (xx > 0)) | ((yy % sz == 0) & (yy > 0))
+        pixels = np.where(dark[..., None], ImageColor.getrgb(Colors.DARK_BG), ImageColor.getrgb(Colors.LIGHT_BG))
+        base = Image.fromarray(pixels.astype(np.uint8))
         return PatternGenerator._apply_wave(base, 100, 0.008)
 
     @staticmethod
+    @_cached_pattern
     def geometric_illusion_v2() -> Image.Image:
         w, h = 260, 130
-        base = Image.new("RGB", (w, h), Colors.LIGHT_BG)
-        inv = Image.new("RGB", (w, h), Colors.DARK_BG)
-        db, di = ImageDraw.Draw(base), ImageDraw.Draw(inv)
-        
         sw, period = 38, 78
-        for x in range(-55 % period - period, w, period):
-            db.rectangle([x, 0, x + sw, h], fill=Colors.DARK_BG)
-            di.rectangle([x, 0, x + sw, h], fill=Colors.LIGHT_BG)
-            
-        mask = Image.new("L", (w, h), 0)
-        dm = ImageDraw.Draw(mask)
+        yy, xx = np.ogrid[:h, :w]
+        # Vertical stripes (edge-inclusive like PIL rectangles), inverted inside a wide annulus
+        stripe = (xx + 55) % period <= sw
         cx, cy, tx, ty = -w*0.4, -h*2.6, w*0.35, h*0.2
         r = math.hypot(tx - cx, ty - cy)
         thick = sw * 1.8
-        dm.ellipse([cx - (r+thick/2), cy - (r+thick/2), cx + (r+thick/2), cy + (r+thick/2)], fill=255)
-        dm.ellipse([cx - (r-thick/2), cy - (r-thick/2), cx + (r-thick/2), cy + (r-thick/2)], fill=0)
-        return Image.composite(inv, base, mask)
+        dist = np.hypot(xx - cx, yy - cy)
+        band = (dist <= r + thick/2) & (dist > r - thick/2)
+        return PatternGenerator._two_tone(stripe ^ band, Colors.DARK_BG, Colors.LIGHT_BG)
 
     @staticmethod
+    @_cached_pattern
     def op_art_ovals(scale: float = 1.0) -> Image.Image:
         W, H = 460, 700
-        c_bg, c_fg = Colors.LIGHT_BG, Colors.DARK_BG
         sw = 55
-        
-        base = Image.new("RGB", (W, H), c_bg)
-        inv = Image.new("RGB", (W, H), c_fg)
-        db, di = ImageDraw.Draw(base), ImageDraw.Draw(inv)
-        
-        for x in range(sw, W, sw * 2):
-            db.rectangle([x, 0, min(x + sw, W), H], fill=c_fg)
-            di.rectangle([x, 0, min(x + sw, W), H], fill=c_bg)
+        yy, xx = np.ogrid[:H, :W]
+        # Vertical stripes (edge-inclusive like PIL rectangles), inverted inside a crescent
+        stripe = (xx >= sw) & ((xx - sw) % (sw * 2) <= sw)
 
-        mask = Image.new("L", (W, H), 0)
-        dm = ImageDraw.Draw(mask)
-        
         ox, oy = W + 390, H // 2 - 35
         orx, ory = 850, 430
-        dm.ellipse([ox - orx, oy - ory, ox + orx, oy + ory], fill=255)
-        
         ix, iy = W + 570, H // 2 - 35
         irx, iry = 905, 360
-        dm.ellipse([ix - irx, iy - iry, ix + irx, iy + iry], fill=0)
+        outer = ((xx - ox) / orx)**2 + ((yy - oy) / ory)**2 <= 1
+        inner = ((xx - ix) / irx)**2 + ((yy - iy) / iry)**2 <= 1
 
-        final = Image.composite(inv, base, mask)
+        final = PatternGenerator._two_tone(stripe ^ (outer & ~inner), Colors.DARK_BG, Colors.LIGHT_BG)
         if scale != 1.0:
             final = final.resize((int(W * scale), int(H * scale)), resample=Image.BICUBIC)
         return final
 
+    @staticmethod
+    @_cached_pattern
+    def album_dots(top: int, row_spacing: float, grid_box: Tuple[int, int, int, int]) -> Image.Image:
+        """Transparent full-card overlay of staggered dots behind the top albums grid."""
+        pat = Image.new("RGBA", (WIDTH, HEIGHT), (0,0,0,0))
+        draw = ImageDraw.Draw(pat)
+        sp_x, r = WIDTH / 5, 60
+        gx0, gy0, gx1, gy1 = grid_box
+        for row in range(8):
+            y = top + row * row_spacing
+            count, offset = (5, sp_x/2) if row % 2 == 0 else (6, 0)
+            for c in range(count):
+                cx = c * sp_x + offset
+                # Dots entirely under the opaque grid would be painted over anyway
+                if gx0 <= cx-r and cx+r <= gx1 and gy0 <= y-r and y+r <= gy1:
+                    continue
+                draw.ellipse([cx-r, y-r, cx+r, y+r], fill=Colors.DARK_BG)
+        return pat
+
+    @staticmethod
+    @_cached_pattern
+    def genre_bubbles() -> Image.Image:
+        """Transparent full-card overlay of bubbles and strokes for the top genres card."""
+        pat = Image.new("RGBA", (WIDTH, HEIGHT), (0,0,0,0))
+        draw = ImageDraw.Draw(pat)
+        for x, y, r in [(850, 1100, 60), (980, 1250, 70), (800, 1350, 50), (1020, 1450, 65), (900, 1600, 55), (750, 1700, 45), (950, 950, 55)]:
+            draw.ellipse((x-r, y-r, x+r, y+r), fill=Colors.DARK_BG)
+        for x, y, r in [(700, 1450, 50), (850, 1550, 60), (650, 1650, 45), (800, 1750, 55), (950, 1700, 65), (1050, 1600, 50)]:
+            draw.ellipse((x-r, y-r, x+r, y+r), fill="#fe4635")
+        draw.arc((100, 1750, 900, 1950), 180, 360, fill=Colors.DARK_BG, width=3)
+        draw.line((300, 1850, 1000, 1700), fill=Colors.DARK_BG, width=3)
+        return pat
+
 # --- CARD RENDERER ---
 
 class CardRenderer:
     def __init__(self, bg_color: str = Colors.DARK_BG):
-        self.img = Image.new("RGBA", (WIDTH, HEIGHT), bg_color)
+        # Cards are always opaque, so skip the alpha band; RGBA overlays paste with their own mask
+        self.img = Image.new("RGB", (WIDTH, HEIGHT), bg_color)
         self.draw = ImageDraw.Draw(self.img)
         self.bg_color = bg_color
         self.is_light = (bg_color == Colors.LIGHT_BG)
@@ -418,8 +522,7 @@ class CardRenderer:
         col = text_col if text_col else (Colors.DARK_BG if bg_box else (Colors.DARK_BG if self.is_light else Colors.LIGHT_BG))
         
         if bg_box:
-            dummy = ImageDraw.Draw(Image.new("L", (1,1)))
-            box_w = DrawUtils._safe_textlength(dummy, text, font) * 1.3 + 60
+            box_w = DrawUtils._safe_textlength(_DUMMY_DRAW, text, font) * 1.3 + 60
             box_h = 90
             bx = (WIDTH - box_w) // 2
             self.draw.rectangle((bx, y_pos, bx + box_w, y_pos + box_h), fill=bg_box)
@@ -432,9 +535,8 @@ class CardRenderer:
         font = AssetManager.get_font(50, 'bold')
         color = Colors.DARK_BG if self.is_light else Colors.TEXT_GREY
         
-        logo = AssetManager.get_icon(self.is_light)
+        logo = AssetManager.get_footer_logo(self.is_light)
         if logo:
-            logo = logo.resize((105, 105), Image.Resampling.LANCZOS)
             self.img.paste(logo, (60, HEIGHT - 150), logo)
             
         w = DrawUtils._safe_textlength(self.draw, FOOTER_URL, font)
@@ -457,18 +559,11 @@ def draw_top_albums(items: List[Dict]) -> Image.Image:
     w_big = (total_w - gap) // 2
     w_small = (total_w - 2*gap) // 3
     
-    pat = Image.new("RGBA", (WIDTH, HEIGHT), (0,0,0,0))
-    pd = ImageDraw.Draw(pat)
-    sp_x, r = WIDTH / 5, 60
-    for row in range(8):
-        y = cy + row * (w_big + w_small + gap) / 7
-        count, offset = (5, sp_x/2) if row % 2 == 0 else (6, 0)
-        for c in range(count):
-            cx = c * sp_x + offset
-            pd.ellipse([cx-r, y-r, cx+r, y+r], fill=Colors.DARK_BG)
+    grid_box = (eff_margin, cy, eff_margin + total_w, cy + w_big + gap + w_small)
+    pat = PatternGenerator.album_dots(cy, (w_big + w_small + gap) / 7, grid_box)
     card.img.paste(pat, (0, 0), pat)
 
-    card.draw.rectangle((eff_margin, cy, eff_margin + total_w, cy + w_big + gap + w_small), fill=Colors.DARK_BG)
+    card.draw.rectangle(grid_box, fill=Colors.DARK_BG)
     coords = [
         (eff_margin, cy, w_big, w_big), (eff_margin + w_big + gap, cy, w_big, w_big),
         (eff_margin, cy + w_big + gap, w_small, w_small),
@@ -476,6 +571,9 @@ def draw_top_albums(items: List[Dict]) -> Image.Image:
         (eff_margin + (w_small + gap)*2, cy + w_big + gap, w_small, w_small)
     ]
     
+    f_rank_grid = AssetManager.get_font(40, 'black')
+    f_rank, f_name, f_sub = AssetManager.get_font(50, 'black'), AssetManager.get_font(45, 'black'), AssetManager.get_font(35)
+    
     for i, (x, y, w, h) in enumerate(coords):
         if i >= len(items): break
         if img := items[i].get('image'):
@@ -485,19 +583,19 @@ def draw_top_albums(items: List[Dict]) -> Image.Image:
         
         ts = 60
         card.draw.rectangle((x+w-ts, y+h-ts, x+w, y+h), fill=Colors.LIGHT_BG)
-        DrawUtils.draw_flat_text(card.img, (x+w-ts/2, y+h-ts/2), str(i+1), AssetManager.get_font(40, 'black'), Colors.DARK_BG, 1.3, "mm", kerning=0)
+        DrawUtils.draw_flat_text(card.img, (x+w-ts/2, y+h-ts/2), str(i+1), f_rank_grid, Colors.DARK_BG, 1.3, "mm", kerning=0)
 
     # List
     ly = cy + w_big + gap + w_small + 100
     for i, item in enumerate(items[:5]):
         y = ly + (i * 120)
-        DrawUtils.draw_flat_text(card.img, (eff_margin, y), str(i+1), AssetManager.get_font(50, 'black'), Colors.DARK_BG, 1.3, "lt", kerning=0)
+        DrawUtils.draw_flat_text(card.img, (eff_margin, y), str(i+1), f_rank, Colors.DARK_BG, 1.3, "lt", kerning=0)
         
-        nm = DrawUtils.truncate(card.draw, item['name'], AssetManager.get_font(45, 'black'), 750)
-        DrawUtils.draw_flat_text(card.img, (eff_margin + 60, y), nm, AssetManager.get_font(45, 'black'), Colors.DARK_BG, 1.2, "lt", kerning=0)
+        nm = DrawUtils.truncate(card.draw, item['name'], f_name, 750)
+        DrawUtils.draw_flat_text(card.img, (eff_margin + 60, y), nm, f_name, Colors.DARK_BG, 1.2, "lt", kerning=0)
         
-        sub = DrawUtils.truncate(card.draw, item.get('sub', ''), AssetManager.get_font(35), 750)
-        card.draw.text((eff_margin + 60, y+55), sub, font=AssetManager.get_font(35), fill="#444")
+        sub = DrawUtils.truncate(card.draw, item.get('sub', ''), f_sub, 750)
+        card.draw.text((eff_margin + 60, y+55), sub, font=f_sub, fill="#444")
         
     return card.get_image()
 
@@ -505,14 +603,7 @@ def draw_top_genres(genres: List[str]) -> Image.Image:
     card = CardRenderer(Colors.LIGHT_BG)
     
     # Background
-    pat = Image.new("RGBA", (WIDTH, HEIGHT), (0,0,0,0))
-    pd = ImageDraw.Draw(pat)
-    for x, y, r in [(850, 1100, 60), (980, 1250, 70), (800, 1350, 50), (1020, 1450, 65), (900, 1600, 55), (750, 1700, 45), (950, 950, 55)]:
-        pd.ellipse((x-r, y-r, x+r, y+r), fill=Colors.DARK_BG)
-    for x, y, r in [(700, 1450, 50), (850, 1550, 60), (650, 1650, 45), (800, 1750, 55), (950, 1700, 65), (1050, 1600, 50)]:
-        pd.ellipse((x-r, y-r, x+r, y+r), fill="#fe4635")
-    pd.arc((100, 1750, 900, 1950), 180, 360, fill=Colors.DARK_BG, width=3)
-    pd.line((300, 1850, 1000, 1700), fill=Colors.DARK_BG, width=3)
+    pat = PatternGenerator.genre_bubbles()
     card.img.paste(pat, (0,0), pat)
 
     # Bubbles
@@ -522,29 +613,9 @@ def draw_top_genres(genres: List[str]) -> Image.Image:
     genre_kerning = -2
 
     for g in genres[:5]:
-        d = ImageDraw.Draw(Image.new("RGBA", (1,1)))
-        
-        # Manual width calc
-        w_text = 0
-        char_widths = []
-        for char in g:
-            cw = DrawUtils._safe_textlength(d, char, f_src)
-            char_widths.append(cw)
-            w_text += cw + genre_kerning
-        w_text = max(1, w_text - genre_kerning if w_text > 0 else 1)
-        
-        bb = DrawUtils._safe_textbbox(d, (0,0), g, f_src)
-        h = bb[3]-bb[1]+20
-        
-        txt = Image.new("RGBA", (int(w_text), h), (0,0,0,0))
-        d_txt = ImageDraw.Draw(txt)
+        txt, w_text, h = DrawUtils._render_text_layer(g, f_src, Colors.LIGHT_BG, genre_kerning)
         
-        cx = 0
-        for i, char in enumerate(g):
-            d_txt.text((cx, 0), char, font=f_src, fill=Colors.LIGHT_BG)
-            cx += char_widths[i] + genre_kerning
-        
-        squished = txt.resize((int(w_text*1.3), h), resample=Image.BICUBIC)
+        squished = txt.resize((int(w_text*1.3), h), resample=Image.Resampling.BILINEAR)
         target_w = box_w - 10
         ratio = target_w / squished.width
         new_h = int(h * ratio)
@@ -553,7 +624,7 @@ def draw_top_genres(genres: List[str]) -> Image.Image:
             target_w = int(squished.width * ratio)
             new_h = 230
             
-        final_txt = squished.resize((int(target_w), int(new_h)), resample=Image.BICUBIC)
+        final_txt = squished.resize((int(target_w), int(new_h)), resample=Image.Resampling.BILINEAR)
         box = Image.new("RGBA", (int(target_w + 10 if new_h == 230 else box_w), int(new_h + 60)), Colors.DARK_BG)
         box.paste(final_txt, (5, 30), final_txt)
         assets.append(box)
@@ -563,8 +634,9 @@ def draw_top_genres(genres: List[str]) -> Image.Image:
     DrawUtils.draw_flat_text(card.img, (CENTER_X, (HEIGHT - sum(a.height + gap_size for a in assets)) // 2 - 100), "My Top Genres", AssetManager.get_font(60, 'black'), Colors.DARK_BG, 1.3, "mt", kerning=-2)
     
     cy = (HEIGHT - sum(a.height + gap_size for a in assets)) // 2 + 20
+    f_rank = AssetManager.get_font(100, 'black')
     for i, box in enumerate(assets):
-        DrawUtils.draw_flat_text(card.img, (box_x - 30, cy + box.height//2), str(i+1), AssetManager.get_font(100, 'black'), Colors.DARK_BG, 1.4, "rm", kerning=-2)
+        DrawUtils.draw_flat_text(card.img, (box_x - 30, cy + box.height//2), str(i+1), f_rank, Colors.DARK_BG, 1.4, "rm", kerning=-2)
         card.img.paste(box, (box_x, int(cy)))
         cy += box.height + gap_size
         
@@ -582,12 +654,12 @@ def draw_listening_age(age: int, label: str) -> Image.Image:
     prefix = "Early" if peak%10 < 4 else ("Mid" if peak%10 < 7 else "Late")
     txt_parts = [("Since I was into music from ", 'book'), ("the ", 'book'), (f"{prefix} ", 'black'), (f"{str(dec)[-2:]}s", 'black')]
     
-    total_w = sum(DrawUtils._safe_textlength(card.draw, t, AssetManager.get_font(45, w)) for t, w in txt_parts)
-    cx = (WIDTH - total_w) / 2
-    for txt, weight in txt_parts:
-        font = AssetManager.get_font(45, weight)
-        DrawUtils.draw_flat_text(card.img, (cx, 1300), txt, font, Colors.DARK_BG, 1.0, "lm", kerning=0)
-        cx += DrawUtils._safe_textlength(card.draw, txt, font)
+    fonts = {weight: AssetManager.get_font(45, weight) for weight in ('book', 'black')}
+    part_widths = [DrawUtils._safe_textlength(card.draw, t, fonts[w]) for t, w in txt_parts]
+    cx = (WIDTH - sum(part_widths)) / 2
+    for (txt, weight), part_w in zip(txt_parts, part_widths):
+        DrawUtils.draw_flat_text(card.img, (cx, 1300), txt, fonts[weight], Colors.DARK_BG, 1.0, "lm", kerning=0)
+        cx += part_w
         
     return card.get_image()
 
@@ -598,20 +670,21 @@ def draw_top_songs(items: List[Dict]) -> Image.Image:
     card.add_header("My Top Songs", y_pos=310, bg_box=Colors.LIGHT_BG)
 
     sy = 570
+    f_rank, f_name, f_sub = AssetManager.get_font(100, 'black'), AssetManager.get_font(55, 'black'), AssetManager.get_font(40)
     for i, item in enumerate(items[:5]):
         y = sy + (i * 230)
-        DrawUtils.draw_flat_text(card.img, (120, y), str(i+1), AssetManager.get_font(100, 'black'), Colors.LIGHT_BG, 1.3, "mm", kerning=0)
+        DrawUtils.draw_flat_text(card.img, (120, y), str(i+1), f_rank, Colors.LIGHT_BG, 1.3, "mm", kerning=0)
         
         if item.get('image'):
             card.img.paste(item['image'].resize((180, 180)), (220, y - 90))
         else:
             card.draw.rectangle((220, y - 90, 400, y + 90), fill=Colors.PLACEHOLDER)
             
-        nm = DrawUtils.truncate(card.draw, item['name'], AssetManager.get_font(55, 'black'), (WIDTH - 490)/1.15)
-        DrawUtils.draw_flat_text(card.img, (440, y - 20), nm, AssetManager.get_font(55, 'black'), Colors.LIGHT_BG, 1.15, "lm", kerning=-2)
+        nm = DrawUtils.truncate(card.draw, item['name'], f_name, (WIDTH - 490)/1.15)
+        DrawUtils.draw_flat_text(card.img, (440, y - 20), nm, f_name, Colors.LIGHT_BG, 1.15, "lm", kerning=-2)
         
-        sub = DrawUtils.truncate(card.draw, item.get('sub', ''), AssetManager.get_font(40), WIDTH - 490)
-        card.draw.text((440, y + 45), sub, font=AssetManager.get_font(40), fill=Colors.LIGHT_BG)
+        sub = DrawUtils.truncate(card.draw, item.get('sub', ''), f_sub, WIDTH - 490)
+        card.draw.text((440, y + 45), sub, font=f_sub, fill=Colors.LIGHT_BG)
         
     return card.get_image()
 
@@ -629,11 +702,12 @@ def draw_top_song_single(item: Dict) -> Image.Image:
     DrawUtils.draw_flat_text(card.img, (CENTER_X, y+sz+150), "My Top Song", AssetManager.get_font(50, 'black'), Colors.LIGHT_BG, 1.4, "mm", kerning=-2)
     
     safe_w = WIDTH - 120
-    nm = DrawUtils.truncate(card.draw, item['name'], AssetManager.get_font(90, 'black'), safe_w / 1.4) 
-    DrawUtils.draw_flat_text(card.img, (CENTER_X, y+sz+280), nm, AssetManager.get_font(90, 'black'), Colors.LIGHT_BG, 1.4, "mm", kerning=-2)
+    f_name, f_sub = AssetManager.get_font(90, 'black'), AssetManager.get_font(50)
+    nm = DrawUtils.truncate(card.draw, item['name'], f_name, safe_w / 1.4) 
+    DrawUtils.draw_flat_text(card.img, (CENTER_X, y+sz+280), nm, f_name, Colors.LIGHT_BG, 1.4, "mm", kerning=-2)
     
-    sub = DrawUtils.truncate(card.draw, item.get('sub', ''), AssetManager.get_font(50), safe_w)
-    card.draw.text((CENTER_X, y+sz+380), sub, font=AssetManager.get_font(50), fill=Colors.LIGHT_BG, anchor="mm")
+    sub = DrawUtils.truncate(card.draw, item.get('sub', ''), f_sub, safe_w)
+    card.draw.text((CENTER_X, y+sz+380), sub, font=f_sub, fill=Colors.LIGHT_BG, anchor="mm")
     
     DrawUtils.draw_flat_text(card.img, (CENTER_X, y+sz+500), "Total Plays", AssetManager.get_font(40, 'medium'), Colors.LIGHT_BG, 1.0, "mm", kerning=0)
     val = f"{int(item.get('count', 0)):,}"
@@ -656,23 +730,15 @@ def draw_minutes_card(minutes: int) -> Image.Image:
     DrawUtils.draw_flat_text(card.img, (CENTER_X, 1050), f"That's {int(minutes / 1440)} days.", AssetManager.get_font(50, 'medium'), Colors.LIGHT_BG, 1.0, "mm", kerning=0)
     return card.get_image()
 
-def draw_summary_card(data: Dict[str, Any]) -> Image.Image:
-    # Pattern
-    p_name = random.choice(["weezer", "paramore", "sabrina", "jessie"])
-    is_dark = p_name in ["weezer", "paramore"]
-    card = CardRenderer(Colors.DARK_BG if is_dark else Colors.LIGHT_BG)
-    card.img.paste(getattr(PatternGenerator, p_name)(), (WIDTH - 800, 0))
-    c_txt, c_sub = (Colors.LIGHT_BG, "#BBB") if is_dark else (Colors.DARK_BG, "#444")
-
-    # Background Year
-    yr = data.get('year_label', "2025")
+@functools.lru_cache(maxsize=64)
+def _render_year_stack(yr: str, fill_col: str, outline_col: str) -> Image.Image:
+    """Renders the outlined, stretched and rotated year shown down the summary card's edge. Cached; paste only."""
     f_yr = AssetManager.get_font(290, 'black')
     
-    dummy = ImageDraw.Draw(Image.new("L", (1,1)))
     chars = []
     x = 16
     for c in yr:
-        w = DrawUtils._safe_textlength(dummy, c, f_yr)
+        w = DrawUtils._safe_textlength(_DUMMY_DRAW, c, f_yr)
         chars.append((c, x, w))
         x += w - 47
     
@@ -690,10 +756,9 @@ def draw_summary_card(data: Dict[str, Any]) -> Image.Image:
             dd.text((cx, 10), c, font=f_yr, fill=255)
     outline = ImageChops.subtract(dilated, mask)
     
-    fill_col = Colors.get_age_color(data.get('age_data', {}).get('age', 25))
     final_yr = Image.new("RGBA", mask.size, (0,0,0,0))
     df = ImageDraw.Draw(final_yr)
-    final_yr.paste(c_txt, (0,0), outline)
+    final_yr.paste(outline_col, (0,0), outline)
     for c, cx, _ in chars: df.text((cx, 10), c, font=f_yr, fill=fill_col)
     
     try:
@@ -704,7 +769,20 @@ def draw_summary_card(data: Dict[str, Any]) -> Image.Image:
         logging.warning(f"Could not crop year image: {e}")
     
     final_yr = final_yr.resize((max(1, int(final_yr.width * 1.6)), max(1, final_yr.height)), Image.BICUBIC)
-    rotated = final_yr.rotate(90, expand=True)
+    return final_yr.rotate(90, expand=True)
+
+def draw_summary_card(data: Dict[str, Any]) -> Image.Image:
+    # Pattern
+    p_name = random.choice(["weezer", "paramore", "sabrina", "jessie"])
+    is_dark = p_name in ["weezer", "paramore"]
+    card = CardRenderer(Colors.DARK_BG if is_dark else Colors.LIGHT_BG)
+    card.img.paste(getattr(PatternGenerator, p_name)(), (WIDTH - 800, 0))
+    c_txt, c_sub = (Colors.LIGHT_BG, "#BBB") if is_dark else (Colors.DARK_BG, "#444")
+
+    # Background Year
+    yr = data.get('year_label', "2025")
+    fill_col = Colors.get_age_color(data.get('age_data', {}).get('age', 25))
+    rotated = _render_year_stack(yr, fill_col, c_txt)
     card.img.paste(rotated, (10, 0), rotated)
 
     # Top Artist
@@ -717,90 +795,92 @@ def draw_summary_card(data: Dict[str, Any]) -> Image.Image:
 
     # Lists
     y = ay + asz + 180
+    f_label, f_item, f_stat = AssetManager.get_font(40, 'medium'), AssetManager.get_font(40, 'bold'), AssetManager.get_font(80, 'black')
     def draw_list(x, title, items):
-        card.draw.text((x, y), title, font=AssetManager.get_font(40, 'medium'), fill=c_sub)
+        card.draw.text((x, y), title, font=f_label, fill=c_sub)
         for i, item in enumerate(items[:5]):
-            nm = DrawUtils.truncate(card.draw, item['name'], AssetManager.get_font(40, 'bold'), 450)
-            card.draw.text((x, y+60+i*55), f"{i+1}  {nm}", font=AssetManager.get_font(40, 'bold'), fill=c_txt)
+            nm = DrawUtils.truncate(card.draw, item['name'], f_item, 450)
+            card.draw.text((x, y+60+i*55), f"{i+1}  {nm}", font=f_item, fill=c_txt)
             
     draw_list(MARGIN_X, "Top Artists", data.get('top_artists_list', []))
     draw_list(CENTER_X + 30, "Top Songs", data.get('top_songs', []))
     
     # Stats
     ys = y + 420
-    card.draw.text((MARGIN_X, ys), "Minutes Listened", font=AssetManager.get_font(40, 'medium'), fill=c_sub)
-    card.draw.text((MARGIN_X, ys+60), f"{data.get('total_minutes',0):,}", font=AssetManager.get_font(80, 'black'), fill=c_txt)
-    card.draw.text((CENTER_X + 30, ys), "Top Genre", font=AssetManager.get_font(40, 'medium'), fill=c_sub)
-    card.draw.text((CENTER_X + 30, ys+60), data.get('genres', ["Unknown"])[0], font=AssetManager.get_font(80, 'black'), fill=c_txt)
+    card.draw.text((MARGIN_X, ys), "Minutes Listened", font=f_label, fill=c_sub)
+    card.draw.text((MARGIN_X, ys+60), f"{data.get('total_minutes',0):,}", font=f_stat, fill=c_txt)
+    card.draw.text((CENTER_X + 30, ys), "Top Genre", font=f_label, fill=c_sub)
+    card.draw.text((CENTER_X + 30, ys+60), data.get('genres', ["Unknown"])[0], font=f_stat, fill=c_txt)
     
     return card.get_image()
 
 # --- ORCHESTRATOR ---
 
 def generate_card_stack(data: Dict[str, Any]) -> List[Image.Image]:
-    cards = []
+    # (log label, card name, renderer, args) in display order
+    jobs = []
     
     if data.get('top_albums'):
-        logging.info("Generating: Top Albums")
-        img = draw_top_albums(data['top_albums'])
-        img.info['card_name'] = "Top_Albums"
-        cards.append(img)
+        jobs.append(("Top Albums", "Top_Albums", draw_top_albums, (data['top_albums'],)))
 
     if data.get('genres'):
-        logging.info("Generating: Genres")
-        img = draw_top_genres(data['genres'])
-        img.info['card_name'] = "Top_Genres"
-        cards.append(img)
+        jobs.append(("Genres", "Top_Genres", draw_top_genres, (data['genres'],)))
 
     if data.get('age_data'):
-        logging.info("Generating: Listening Age")
-        img = draw_listening_age(data['age_data']['age'], data['age_data']['label'])
-        img.info['card_name'] = "Listening_Age"
-        cards.append(img)
+        jobs.append(("Listening Age", "Listening_Age", draw_listening_age, (data['age_data']['age'], data['age_data']['label'])))
 
     if data.get('top_songs'):
-        logging.info("Generating: Top Songs List")
-        img1 = draw_top_songs(data['top_songs'])
-        img1.info['card_name'] = "Top_Songs_List"
-        cards.append(img1)
-        
-        logging.info("Generating: Top Song Single")
-        img2 = draw_top_song_single(data['top_songs'][0])
-        img2.info['card_name'] = "Top_Song_Single"
-        cards.append(img2)
+        jobs.append(("Top Songs List", "Top_Songs_List", draw_top_songs, (data['top_songs'],)))
+        jobs.append(("Top Song Single", "Top_Song_Single", draw_top_song_single, (data['top_songs'][0],)))
 
     if data.get('total_minutes'):
-        logging.info("Generating: Minutes Listened")
-        img = draw_minutes_card(data['total_minutes'])
-        img.info['card_name'] = "Minutes_Listened"
-        cards.append(img)
+        jobs.append(("Minutes Listened", "Minutes_Listened", draw_minutes_card, (data['total_minutes'],)))
+
+    jobs.append(("Summary Card", "Summary", draw_summary_card, (data,)))
+
+    # Cards are independent and Pillow releases the GIL while resizing/compositing,
+    # so render them concurrently and collect in order
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        futures = []
+        for label, card_name, renderer, args in jobs:
+            logging.info(f"Generating: {label}")
+            futures.append((card_name, pool.submit(renderer, *args)))
 
-    logging.info("Generating: Summary Card")
-    img = draw_summary_card(data)
-    img.info['card_name'] = "Summary"
-    cards.append(img)
+    cards = []
+    for card_name, future in futures:
+        img = future.result()
+        img.info['card_name'] = card_name
+        cards.append(img)
     
     return cards
 
+def _save_card(img: Image.Image, full_path: str) -> bool:
+    try:
+        (img if img.mode == "RGB" else img.convert("RGB")).save(full_path, "JPEG", quality=95)
+        logging.info(f"Saved: {full_path}")
+        return True
+    except Exception as e:
+        logging.error(f"Failed to save image {full_path}: {e}")
+        return False
+
 def save_card_stack(images: List[Image.Image], output_path: str, indices: Optional[Set[int]] = None) -> int:
     if not os.path.exists(output_path):
         os.makedirs(output_path)
     
-    count = 0
     save_indices = indices if indices is not None else range(len(images))
+    ts = datetime.datetime.now().strftime("%H%M%S")
     
+    jobs = []
     for i in save_indices:
         if i < len(images):
-            try:
-                img = images[i]
-                base_name = img.info.get('card_name', f"Wrapped_{i+1}")
-                ts = datetime.datetime.now().strftime("%H%M%S")
-                filename = f"TunesBack_{base_name}_{ts}.jpg"
-                full_path = os.path.join(output_path, filename)
-                img.convert("RGB").save(full_path, "JPEG", quality=95)
-                logging.info(f"Saved: {full_path}")
-                count += 1
-            except Exception as e:
-                logging.error(f"Failed to save image {i}: {e}")
-                
-    return count
\ No newline at end of file
+            img = images[i]
+            base_name = img.info.get('card_name', f"Wrapped_{i+1}")
+            filename = f"TunesBack_{base_name}_{ts}.jpg"
+            jobs.append((img, os.path.join(output_path, filename)))
+    
+    if not jobs:
+        return 0
+    
+    # libjpeg releases the GIL while encoding, so the cards can be written in parallel
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+        return sum(pool.map(lambda job: _save_card(*job), jobs))
\ No newline at end of file
@@ -40,18 +40,21 @@ def calculate_listening_age(plays_per_year: dict, current_year: int = None) -> i
     max_play_count = 0
     best_start_year = min_year
 
-    # Optimization: Iterate only years that exist as keys to skip gaps, 
-    # but range is safer for the window logic.
+    # Sliding window: add the year entering the window, drop the one leaving it
+    current_window_sum = 0
+    for i in range(WINDOW_SIZE - 1):
+        current_window_sum += valid_data.get(min_year + i, 0)
+
     for start_year in range(min_year, max_year + 1):
         # Sum plays for the window [start_year, start_year + 4]
-        current_window_sum = 0
-        for i in range(WINDOW_SIZE):
-            current_window_sum += valid_data.get(start_year + i, 0)
+        current_window_sum += valid_data.get(start_year + WINDOW_SIZE - 1, 0)
         
         if current_window_sum > max_play_count:
             max_play_count = current_window_sum
             best_start_year = start_year
 
+        current_window_sum -= valid_data.get(start_year, 0)
+
     # Determine Center Year of the Era
     # e.g., If window is 2015-2019, center is 2017
     center_era_year = best_start_year + (WINDOW_SIZE // 2)
@@ -2,19 +2,28 @@ from __future__ import annotations
 
 import sys
 import os
+import functools
+import hashlib
+import heapq
 import threading
+import time
 import traceback
 import datetime
 import base64
+import pickle
 import platform
+import re
 import urllib.parse
 import urllib.request
 import logging
 import subprocess
+import sqlite3
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Optional, Tuple, Dict, List, Set, Any
+from typing import Optional, Tuple, Dict, List, Set, Any, Iterator
 from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 
 # --- Third-party Imports ---
@@ -56,6 +65,10 @@ class Theme:
     SIDEBAR_WIDTH = 320
     BUTTON_HEIGHT = 50
     TOGGLE_WIDTH = 280
+    ART_THUMB_SIZE = (100, 100)
+    ART_THUMB_QUALITY = 80  # JPEG quality for cached list thumbnails
+    ART_WRAPPED_SIZE = (750, 750)  # Largest artwork slot on a Wrapped card
+    WRAPPED_PREVIEW_QUALITY = 90  # In-app preview only; saving uses generate_wrapped's own setting
     
     MS_TO_HOURS = 3.6e6
     MS_TO_MINS = 60000
@@ -94,6 +107,19 @@ def get_log_path() -> str:
     os.makedirs(log_dir, exist_ok=True)
     return os.path.join(log_dir, "tunesback.log")
 
+def get_cache_dir() -> str:
+    system = platform.system()
+    if system == "Windows":
+        base = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+        cache_dir = os.path.join(base, APP_NAME, "Cache")
+    elif system == "Darwin":
+        cache_dir = os.path.expanduser(f"~/Library/Caches/{APP_NAME}")
+    else:
+        cache_dir = os.path.expanduser(f"~/.cache/{APP_NAME}")
+    
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
 def configure_dynamic_logging(enable: bool, mode: str = 'w'):
     logger = logging.getLogger()
     
@@ -138,6 +164,25 @@ class EntityStats:
     year: Optional[int] = None
     pids: Set[str] = field(default_factory=set) 
 
+@dataclass
+class TrackRecord:
+    """The subset of libpytunes' Song fields that parse_xml reads, with the same conversions."""
+    name: Optional[str] = None
+    artist: Optional[str] = None
+    album_artist: Optional[str] = None
+    album: Optional[str] = None
+    genre: Optional[str] = None
+    year: Optional[int] = None
+    persistent_id: Optional[str] = None
+    play_count: Optional[int] = None
+    skip_count: Optional[int] = None
+    length: Optional[int] = None
+    date_added: Optional[time.struct_time] = None
+    location: Optional[str] = None
+    podcast: bool = False
+    movie: bool = False
+    has_video: bool = False
+
 @dataclass
 class LibraryData:
     artists: Dict[str, EntityStats] = field(default_factory=lambda: defaultdict(EntityStats))
@@ -147,12 +192,36 @@ class LibraryData:
     years: Dict[int, EntityStats] = field(default_factory=lambda: defaultdict(EntityStats)) 
     master_pid_map: Dict[str, Dict] = field(default_factory=dict)
     total_time: float = 0.0
+    total_play_count: int = 0
     error: Optional[str] = None
 
 # ==========================================
 # UTILITIES
 # ==========================================
 
+def unit_divisor(unit: str) -> float:
+    """Milliseconds per display unit, defaulting to hours."""
+    if unit == Theme.UNIT_MINUTES: return Theme.MS_TO_MINS
+    if unit == Theme.UNIT_DAYS: return Theme.MS_TO_DAYS
+    return Theme.MS_TO_HOURS
+
+DIR_LISTING_TTL = 60.0  # Seconds before a cached mount-point listing is rescanned
+ART_PRELOAD_WORKERS = min(16, (os.cpu_count() or 1) * 2)  # Art preload is mostly file I/O, so oversubscribe
+_dir_listing_cache: Dict[str, Tuple[float, Tuple[str, ...]]] = {}
+
+def _list_dir(path: str) -> Tuple[str, ...]:
+    """Cached os.listdir; returns an empty tuple when the path is missing or unreadable."""
+    now = time.monotonic()
+    cached = _dir_listing_cache.get(path)
+    if cached and now - cached[0] < DIR_LISTING_TTL:
+        return cached[1]
+    try:
+        entries = tuple(os.listdir(path))
+    except OSError:
+        entries = ()
+    _dir_listing_cache[path] = (now, entries)
+    return entries
+
 def resolve_path(file_uri: str) -> Optional[str]:
     if not file_uri:
         return None
@@ -191,21 +260,17 @@ def resolve_path(file_uri: str) -> Optional[str]:
                 
                 # Scan GVFS mounts (GNOME/Nautilus)
                 if os.path.isdir(gvfs_base):
+                    share_targets = tuple(f"{sep}share={variant}" for variant in (share_name_encoded, share_name_normalized)
+                                          for sep in (",", ":"))
+                    decoded_target = f",share={share_name_normalized}"
                     try:
-                        for mount_name in os.listdir(gvfs_base):
+                        for mount_name in _list_dir(gvfs_base):
                             if mount_name.startswith("smb-share:"):
                                 mount_lower = mount_name.lower()
-                                mount_share_decoded = urllib.parse.unquote(mount_lower)
                                 
                                 # Match share name
-                                share_match = False
-                                for share_variant in [share_name_encoded, share_name_normalized]:
-                                    if f",share={share_variant}" in mount_lower or f":share={share_variant}" in mount_lower:
-                                        share_match = True
-                                        break
-                                    if f",share={share_name_normalized}" in mount_share_decoded:
-                                        share_match = True
-                                        break
+                                share_match = (any(t in mount_lower for t in share_targets)
+                                               or decoded_target in urllib.parse.unquote(mount_lower))
                                 
                                 if share_match:
                                     for rpath in [rest_of_path, rest_of_path_decoded]:
@@ -239,14 +304,14 @@ def resolve_path(file_uri: str) -> Optional[str]:
                 # KDE kio-fuse support (Dolphin)
                 kio_fuse_base = f"/run/user/{uid}"
                 try:
-                    for entry in os.listdir(kio_fuse_base):
+                    for entry in _list_dir(kio_fuse_base):
                         if entry.startswith("kio-fuse-"):
                             kio_smb_base = os.path.join(kio_fuse_base, entry, "smb")
                             if os.path.isdir(kio_smb_base):
-                                for kio_host in os.listdir(kio_smb_base):
+                                for kio_host in _list_dir(kio_smb_base):
                                     kio_host_path = os.path.join(kio_smb_base, kio_host)
                                     if os.path.isdir(kio_host_path):
-                                        for kio_share in os.listdir(kio_host_path):
+                                        for kio_share in _list_dir(kio_host_path):
                                             if kio_share.lower() == share_name_decoded.lower():
                                                 for rpath in [rest_of_path, rest_of_path_decoded]:
                                                     candidate = os.path.join(kio_host_path, kio_share, rpath)
@@ -284,7 +349,7 @@ def resolve_path(file_uri: str) -> Optional[str]:
                     
                     likely_share = parts[0]
                     if likely_share and os.path.isdir("/Volumes"):
-                        for vol in os.listdir("/Volumes"):
+                        for vol in _list_dir("/Volumes"):
                             if vol.startswith(likely_share):
                                 candidates.append(os.path.join("/Volumes", vol, *parts[1:]))
 
@@ -300,12 +365,16 @@ def resolve_path(file_uri: str) -> Optional[str]:
         logging.warning(f"Path resolution error for {file_uri}: {e}")
         return None
 
-def extract_art_from_file(file_uri: str) -> Optional[Image.Image]:
+def extract_art_from_file(file_uri: str, max_size: Optional[Tuple[int, int]] = None) -> Optional[Image.Image]:
     path = resolve_path(file_uri)
     
     if not path:
         return None
-    
+    return extract_art_from_path(path, max_size)
+
+def extract_art_from_path(path: str, max_size: Optional[Tuple[int, int]] = None,
+                          raise_errors: bool = False) -> Optional[Image.Image]:
+    """Returns the embedded cover, or None when there is none. Read/decode errors also give None unless raise_errors is set."""
     if not os.path.exists(path):
         logging.warning(f"ArtExtraction: File not found: {path}")
         return None
@@ -328,13 +397,136 @@ def extract_art_from_file(file_uri: str) -> Optional[Image.Image]:
             art_data = f.pictures[0].data
             
         if art_data: 
-            return Image.open(BytesIO(art_data)).convert("RGBA")
+            img = Image.open(BytesIO(art_data))
+            if max_size:
+                # Lets libjpeg decode at 1/2, 1/4 or 1/8 scale while staying >= max_size
+                img.draft("RGB", max_size)
+            return img.convert("RGBA")
             
     except Exception as ex:
+        if raise_errors: raise
         logging.warning(f"ArtExtraction: Exception for {path}: {ex}")
     
     return None
 
+class ThumbnailStore:
+    """
+    Keeps encoded list thumbnails in SQLite between sessions.
+    Keys cover the resolved path, mtime and size, so a retagged file misses and is decoded again.
+    An empty string marks a file known to have no embedded art.
+    """
+    def __init__(self, db_path: str):
+        # Preload workers look thumbnails up concurrently, and a superseded run may still be saving, so access is serialised
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS thumbs (key TEXT PRIMARY KEY, b64 TEXT NOT NULL)")
+
+    @staticmethod
+    def key_for(path: str) -> Optional[str]:
+        """Cache key for an already resolved path, or None if the file can't be stat'ed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        raw = f"{path}|{st.st_mtime_ns}|{st.st_size}|{Theme.ART_THUMB_SIZE}|{Theme.ART_THUMB_QUALITY}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            with self._lock:
+                row = self._conn.execute("SELECT b64 FROM thumbs WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as ex:
+            logging.warning(f"ThumbnailStore: Lookup failed: {ex}")
+            return None
+        return row[0] if row else None
+
+    def put_many(self, items: List[Tuple[str, str]]):
+        try:
+            with self._lock, self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO thumbs (key, b64) VALUES (?, ?)", items)
+        except sqlite3.Error as ex:
+            logging.warning(f"ThumbnailStore: Could not save thumbnails: {ex}")
+
+def _track_from_plist(track_elem: ET.Element) -> TrackRecord:
+    attrs = {}
+    children = iter(track_elem)
+    for key_elem in children:
+        value_elem = next(children)
+        tag = value_elem.tag
+        if tag == 'integer':
+            attrs[key_elem.text] = int(value_elem.text)
+        elif tag in ('true', 'false'):
+            attrs[key_elem.text] = tag == 'true'
+        else:
+            attrs[key_elem.text] = value_elem.text or ''
+
+    get = attrs.get
+    location = get('Location')
+    date_added = get('Date Added')
+    return TrackRecord(
+        name=get('Name'),
+        artist=get('Artist'),
+        album_artist=get('Album Artist'),
+        album=get('Album'),
+        genre=get('Genre'),
+        year=int(get('Year')) if get('Year') else None,
+        persistent_id=get('Persistent ID'),
+        play_count=int(get('Play Count')) if get('Play Count') else None,
+        skip_count=int(get('Skip Count')) if get('Skip Count') else None,
+        length=int(get('Total Time')) if get('Total Time') else None,
+        date_added=time.strptime(date_added, "%Y-%m-%dT%H:%M:%SZ") if date_added else None,
+        location=urllib.parse.unquote(urllib.parse.urlparse(location).path) if location else None,
+        podcast='Podcast' in attrs,
+        movie='Movie' in attrs,
+        has_video='Has Video' in attrs,
+    )
+
+def iter_library_tracks(xml_path: str) -> Iterator[TrackRecord]:
+    """
+    Streams the Tracks dict of an iTunes/Music library plist without building the whole document.
+    Each track element is discarded once converted and parsing stops at the end of Tracks,
+    so playlists are never read. The file is opened eagerly so a missing path raises here.
+    """
+    return _iter_plist_tracks(ET.iterparse(xml_path, events=('start', 'end')))
+
+def _iter_plist_tracks(events) -> Iterator[TrackRecord]:
+    depth = 0
+    root_key = None
+    tracks_elem = None
+    for event, elem in events:
+        if event == 'start':
+            depth += 1
+            # plist > root dict > Tracks dict > track dicts
+            if depth == 3 and elem.tag == 'dict' and root_key == 'Tracks':
+                tracks_elem = elem
+            continue
+
+        if depth == 4 and tracks_elem is not None and elem.tag == 'dict':
+            yield _track_from_plist(elem)
+            tracks_elem.clear()
+        elif depth == 3:
+            if elem is tracks_elem:
+                return
+            if elem.tag == 'key':
+                root_key = elem.text
+        depth -= 1
+
+SNAPSHOT_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+def _snapshot_date(stem: str) -> Optional[datetime.datetime]:
+    """Date in a snapshot filename; names with a lone YYYY-MM-DD skip dateutil's fuzzy parser."""
+    m = SNAPSHOT_DATE_RE.search(stem)
+    if m and not any(c.isdigit() for c in stem[:m.start()] + stem[m.end():]):
+        try:
+            return datetime.datetime(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError:
+            pass
+    try:
+        return parser.parse(stem, fuzzy=True)
+    except Exception:
+        return None
+
 def get_xml_files_in_folder(folder_path: str) -> List[Dict]:
     valid_files = []
     if not os.path.isdir(folder_path):
@@ -342,18 +534,18 @@ def get_xml_files_in_folder(folder_path: str) -> List[Dict]:
     
     logging.info(f"Scanning directory: {folder_path}")
     
-    for f in os.listdir(folder_path):
-        if not f.endswith('.xml'): continue
-        try:
-            dt = parser.parse(os.path.splitext(f)[0], fuzzy=True)
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            f = entry.name
+            if not f.endswith('.xml'): continue
+            dt = _snapshot_date(f[:-4])
+            if dt is None: continue
             valid_files.append({
                 'label': dt.strftime('%Y-%m-%d'),
                 'date': dt,
-                'path': os.path.join(folder_path, f),
+                'path': entry.path,
                 'file': f
             })
-        except:
-            continue
             
     valid_files.sort(key=lambda x: x['date'])
     
@@ -366,6 +558,63 @@ def get_xml_files_in_folder(folder_path: str) -> List[Dict]:
     logging.info(f"Found {len(valid_files)} valid XML snapshots.")
     return valid_files
 
+PARSE_CACHE_VERSION = 1  # Bump whenever parse_xml's output or LibraryData's layout changes
+PARSED_LIBS_KEPT = 2  # Parsed snapshots held in memory: enough for one start/end comparison
+PARSE_CACHE_KEPT = 8  # Parsed snapshots kept on disk, least recently used are pruned first
+
+def _parse_cache_path(xml_path: str) -> str:
+    digest = hashlib.blake2b(os.path.abspath(xml_path).encode(), digest_size=16).hexdigest()
+    return os.path.join(get_cache_dir(), "libraries", f"{digest}.pkl")
+
+def _xml_signature(xml_path: str) -> Tuple[int, int, int]:
+    st = os.stat(xml_path)
+    return (PARSE_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+
+def load_cached_library(xml_path: str) -> Optional[LibraryData]:
+    """Returns the LibraryData saved for this snapshot, or None if there is none or the XML has changed since."""
+    path = _parse_cache_path(xml_path)
+    try:
+        with open(path, 'rb') as f:
+            # The signature is pickled on its own first so a stale entry is rejected without loading the rest
+            if pickle.load(f) != _xml_signature(xml_path):
+                return None
+            data = pickle.load(f)
+        os.utime(path)  # mtime doubles as last use for _prune_parse_cache
+        return data
+    except FileNotFoundError:
+        return None
+    except Exception as ex:
+        logging.warning(f"ParseCache: Ignoring unreadable cache for {xml_path}: {ex}")
+        return None
+
+def save_cached_library(xml_path: str, data: LibraryData):
+    path = _parse_cache_path(xml_path)
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(_xml_signature(xml_path), f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as ex:
+        logging.warning(f"ParseCache: Could not save cache for {xml_path}: {ex}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    _prune_parse_cache(os.path.dirname(path))
+
+def _prune_parse_cache(cache_dir: str):
+    """Drops all but the PARSE_CACHE_KEPT most recently used entries, which also clears out snapshots that were moved or deleted."""
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith('.pkl') and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime_ns, reverse=True)
+        for entry in entries[PARSE_CACHE_KEPT:]:
+            os.remove(entry.path)
+    except OSError as ex:
+        logging.warning(f"ParseCache: Could not prune {cache_dir}: {ex}")
+
 # ==========================================
 # ANALYTICS ENGINE
 # ==========================================
@@ -374,6 +623,10 @@ class LibraryAnalytics:
     @staticmethod
     def split_artists(artist_str: str) -> List[str]:
         if not artist_str: return ["Unknown"]
+        # Most tracks credit a single artist; skip the replace/split work for those
+        if ',' not in artist_str and '&' not in artist_str and '|' not in artist_str:
+            name = artist_str.strip()
+            return [name] if name else ["Unknown"]
         temp = artist_str.replace(',', '|').replace('&', '|')
         parts = [p.strip() for p in temp.split('|') if p.strip()]
         return parts if parts else ["Unknown"]
@@ -382,8 +635,14 @@ class LibraryAnalytics:
     def parse_date(date_val) -> Optional[datetime.datetime]:
         if not date_val: return None
         if isinstance(date_val, datetime.datetime): return date_val
+        return LibraryAnalytics._parse_date_str(str(date_val))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8192)
+    def _parse_date_str(date_str: str) -> Optional[datetime.datetime]:
+        # Date Added values cluster around import/sync times, so most lookups are cache hits
         try:
-            return parser.parse(str(date_val))
+            return parser.parse(date_str)
         except:
             return None
 
@@ -405,17 +664,35 @@ class LibraryAnalytics:
 
     @classmethod
     def parse_xml(cls, xml_path: str) -> LibraryData:
+        cached = load_cached_library(xml_path)
+        if cached is not None:
+            logging.info(f"LibraryAnalytics: Loaded cached parse for: {xml_path}")
+            return cached
+        
+        data = cls._parse_xml_file(xml_path)
+        if not data.error:
+            save_cached_library(xml_path, data)
+        return data
+
+    @classmethod
+    def _parse_xml_file(cls, xml_path: str) -> LibraryData:
         logging.info(f"LibraryAnalytics: Starting XML parse for: {xml_path}")
         data = LibraryData()
+        stream = os.environ.get('TUNESBACK_STREAM_XML') == '1'
         
-        if Library is None:
+        if Library is None and not stream:
             data.error = "libpytunes library missing."
             logging.error(data.error)
             return data
             
         try:
-            lib = Library(xml_path)
-            logging.info("LibraryAnalytics: XML loaded into memory. Processing songs...")
+            if stream:
+                # Streamed tracks are parsed lazily; a file truncated mid-way raises from the loop below
+                songs = iter_library_tracks(xml_path)
+                logging.info("LibraryAnalytics: Streaming tracks from XML...")
+            else:
+                songs = Library(xml_path).songs.values()
+                logging.info("LibraryAnalytics: XML loaded into memory. Processing songs...")
         except Exception as e:
             msg = f"Failed to parse XML: {str(e)}"
             logging.error(msg)
@@ -424,7 +701,7 @@ class LibraryAnalytics:
 
         count_items, skipped_items = 0, 0
         
-        for song in lib.songs.values():
+        for song in songs:
             if song.podcast or song.movie or song.has_video:
                 skipped_items += 1
                 continue
@@ -432,34 +709,36 @@ class LibraryAnalytics:
             count_items += 1
             plays = song.play_count or 0
             skips = song.skip_count or 0
-            length = song.length or 0
-            play_ms = plays * length
             
             if plays == 0 and skips == 0 and not song.date_added:
                 continue
 
+            play_ms = plays * (song.length or 0)
             raw_artist = song.artist or "Unknown"
             album_artist = song.album_artist or raw_artist 
             album = song.album or "Unknown"
             song_name = song.name or "Unknown"
             genre = song.genre
             pid = song.persistent_id
+            location = song.location
+            year = song.year
             date_added = cls.parse_date(song.date_added)
 
             data.total_time += play_ms
+            data.total_play_count += plays
             if pid:
                 data.master_pid_map[pid] = {'count': plays, 'time': play_ms, 'skip': skips}
 
-            cls._update_stat(data.songs[(song_name, raw_artist)], plays, play_ms, skips, pid, song.location, date_added, song.year)
-            cls._update_stat(data.albums[(album, album_artist)], plays, play_ms, skips, pid, song.location, date_added, song.year)
+            cls._update_stat(data.songs[(song_name, raw_artist)], plays, play_ms, skips, pid, location, date_added, year)
+            cls._update_stat(data.albums[(album, album_artist)], plays, play_ms, skips, pid, location, date_added, year)
             
             for ind_art in cls.split_artists(raw_artist):
-                cls._update_stat(data.artists[ind_art], plays, play_ms, skips, pid, song.location, date_added, song.year)
+                cls._update_stat(data.artists[ind_art], plays, play_ms, skips, pid, location, date_added, year)
 
             if genre:
-                cls._update_stat(data.genres[genre], plays, play_ms, skips, pid, song.location, date_added, song.year)
-            if song.year and song.year > 1900:
-                cls._update_stat(data.years[song.year], plays, play_ms, skips, pid, song.location, date_added, song.year)
+                cls._update_stat(data.genres[genre], plays, play_ms, skips, pid, location, date_added, year)
+            if year and year > 1900:
+                cls._update_stat(data.years[year], plays, play_ms, skips, pid, location, date_added, year)
         
         logging.info(f"Parsed Items: {count_items} | Skipped: {skipped_items}")
         logging.info(f"Stats: Songs: {len(data.songs)} | Artists: {len(data.artists)} | Albums: {len(data.albums)}")
@@ -475,12 +754,12 @@ class LibraryAnalytics:
             old_time = old_entity_stats.time
             old_skip = old_entity_stats.skip
         else:
-            for pid in new_stats.pids:
-                if pid in old_master_map:
-                    old_data = old_master_map[pid]
-                    old_count += old_data['count']
-                    old_time += old_data['time']
-                    old_skip += old_data['skip']
+            # Intersect in C so only pids present in the old snapshot are visited
+            for pid in new_stats.pids & old_master_map.keys():
+                old_data = old_master_map[pid]
+                old_count += old_data['count']
+                old_time += old_data['time']
+                old_skip += old_data['skip']
 
         return {
             'diff_time': new_stats.time - old_time,
@@ -497,47 +776,50 @@ class LibraryAnalytics:
         
         logging.info("LibraryAnalytics: Starting differential analysis...")
         
-        divisor = Theme.MS_TO_HOURS
-        if unit == Theme.UNIT_MINUTES: divisor = Theme.MS_TO_MINS
-        elif unit == Theme.UNIT_DAYS: divisor = Theme.MS_TO_DAYS
+        divisor = unit_divisor(unit)
 
         old_master = old_lib.master_pid_map if old_lib else {}
         old_total_time = old_lib.total_time if old_lib else 0.0
         
         diff_total = (new_lib.total_time - old_total_time) / divisor
-        new_plays_total = sum(s.count for s in new_lib.songs.values())
-        old_plays_total = sum(s.count for s in old_lib.songs.values()) if old_lib else 0
+        new_plays_total = new_lib.total_play_count
+        old_plays_total = old_lib.total_play_count if old_lib else 0
         diff_plays = new_plays_total - old_plays_total
         
         logging.info(f"Stats: Time Growth: {diff_total:.2f} {unit} | Play Count Diff: {diff_plays}")
 
-        results = defaultdict(list)
+        # Columnar accumulation: results[list_key][column] -> list of values
+        results = defaultdict(lambda: defaultdict(list))
 
         def _process_category(category_dict, old_category_dict, list_key, label_keys):
+            # Label layout and song-only bookkeeping are fixed per category
+            is_multi_label = isinstance(label_keys, list)
+            is_song = list_key == 'song'
+
+            def add_row(target_key, value, count, location, key):
+                cols = results[target_key]
+                cols['Value'].append(value)
+                cols['Count'].append(count)
+                cols['Location'].append(location)
+                if is_multi_label:
+                    for k, part in zip(label_keys, key):
+                        cols[k].append(part)
+                else:
+                    cols[label_keys].append(key)
+
             for key, stats in category_dict.items():
                 old_stats_obj = old_category_dict.get(key) if old_category_dict else None
                 diffs = cls.calculate_diff(stats, old_master, old_stats_obj)
                 
-                row = {
-                    'Value': diffs['diff_time'] / divisor,
-                    'Count': int(diffs['diff_count']),
-                    'Location': stats.location 
-                }
-                
-                if isinstance(label_keys, list):
-                    for i, k in enumerate(label_keys):
-                        row[k] = key[i] if isinstance(key, tuple) else key
-                else:
-                    row[label_keys] = key
+                value = diffs['diff_time'] / divisor
+                count = int(diffs['diff_count'])
 
                 if diffs['diff_time'] > 0:
-                    results[list_key].append(row)
+                    add_row(list_key, value, count, stats.location, key)
                 
-                if list_key == 'song':
+                if is_song:
                     if diffs['diff_skip'] > 0:
-                        row_skip = row.copy()
-                        row_skip['Value'] = diffs['diff_skip']
-                        results['skip'].append(row_skip)
+                        add_row('skip', diffs['diff_skip'], count, stats.location, key)
                     
                     if diffs['diff_count'] > 0:
                         is_new = False
@@ -550,7 +832,7 @@ class LibraryAnalytics:
                             is_new = True
                             
                         if is_new:
-                            results['new'].append(row)
+                            add_row('new', value, count, stats.location, key)
 
         _process_category(new_lib.artists, old_lib.artists if old_lib else None, 'art', 'Artist')
         _process_category(new_lib.albums, old_lib.albums if old_lib else None, 'alb', ['Album', 'Artist'])
@@ -558,8 +840,8 @@ class LibraryAnalytics:
         _process_category(new_lib.genres, old_lib.genres if old_lib else None, 'gen', 'Genre')
         _process_category(new_lib.years, old_lib.years if old_lib else None, 'year', 'Year')
         
-        genre_df = pd.DataFrame(results['gen'])
-        top_genres = genre_df.sort_values('Count', ascending=False).head(10)['Genre'].tolist() if not genre_df.empty else []
+        gen_cols = results['gen']
+        top_genres = [g for _, g in heapq.nlargest(10, zip(gen_cols['Count'], gen_cols['Genre']), key=lambda r: r[0])]
 
         plays_per_year = {y: stats.count for y, stats in new_lib.years.items() if stats.count > 0}
         calculated_age = listening_age_algorithm.calculate_listening_age(plays_per_year=plays_per_year, current_year=current_year)
@@ -593,7 +875,7 @@ def create_kpi_card(content: ft.Control) -> ft.Container:
 
 def draw_list_item(rank: int, label: str, sub_label: str, value: float, count: int, 
                    unit: str, color: str, is_skip_list: bool=False, art_src_b64: str = None, 
-                   is_circular: bool = False) -> ft.Container:
+                   is_circular: bool = False, art_slot: Optional[ft.Container] = None) -> ft.Container:
     
     stats_text = f"{int(value)} skips" if is_skip_list else f"{value:,.1f} {unit} • {int(count)} plays"
     
@@ -602,6 +884,8 @@ def draw_list_item(rank: int, label: str, sub_label: str, value: float, count: i
     if art_src_b64:
         radius = 50 if is_circular else 8
         left_row.append(ft.Image(src_base64=art_src_b64, width=45, height=45, border_radius=radius, fit=ft.ImageFit.COVER))
+    elif art_slot is not None:
+        left_row.append(art_slot)
     
     left_row.append(
         ft.Column([
@@ -630,20 +914,32 @@ class TunesBackApp:
         self.page = page
         
         self.files = []
+        self._files_by_label: Dict[str, Dict[str, Any]] = {}
         self.full_labels = []
+        self._end_opt_cache: Dict[str, ft.dropdown.Option] = {}
         self.data_frames = {k: pd.DataFrame() for k in ["art", "alb", "song", "gen", "new", "skip", "year"]}
         self.wrapped_data = {"genres": [], "age": 0} 
         self.cached_sorted = {}
+        self._last_ui_sig: Optional[Tuple] = None  # Inputs of the last user-triggered results render
+        self._stats_unit = Theme.UNIT_HOURS  # Unit the Value columns in data_frames are expressed in
+        self._val_main = 0.0
         self.art_cache = {} 
+        self._thumb_store: Optional[ThumbnailStore] = None
+        # Placeholders in the results list waiting on a thumbnail, keyed by file location
+        self._art_slots: Dict[str, List[ft.Container]] = {}
+        self._art_loading = False
+        self._art_lock = threading.Lock()
         self.generated_images = []
         self.selected_indices = set() 
         
         self.lib_start: Optional[LibraryData] = None
         self.lib_end: Optional[LibraryData] = None
+        self._parsed_libs: Dict[str, Tuple[Tuple[int, int, int], LibraryData]] = {}  # path -> (signature, data), oldest first
         self.is_compare_mode = False
         
         self.analysis_thread: Optional[threading.Thread] = None
         self.cancel_analysis = False
+        self._run_id = 0  # Bumped by each run and reset; background work from an older run discards its results
         
         self.current_tab = "song" 
         self.visible_tabs = {"song", "alb", "art", "gen"} 
@@ -656,6 +952,7 @@ class TunesBackApp:
             ("skip", "Skipped", "fast_forward"),
             ("year", "Years", "calendar_month") 
         ]
+        self._tab_button_cache: Dict[str, ft.Container] = {}
         
         self._build_ui()
 
@@ -720,8 +1017,10 @@ class TunesBackApp:
         self.txt_app_title = ft.Text("TunesBack", weight="bold", size=14, color=Theme.SUBTEXT, opacity=0, animate_opacity=300)
 
         self.tabs_row = ft.Row(spacing=0, scroll="auto", expand=True)
+        # Idle label is swapped out for a spinner while cards render; built once and swapped back in
+        self.wrapped_btn_label = ft.Row([ft.Icon("auto_awesome"), ft.Text("Generate Wrapped Cards")], alignment="center", spacing=10)
         self.btn_wrapped = ft.ElevatedButton(
-            content=ft.Row([ft.Icon("auto_awesome"), ft.Text("Generate Wrapped Cards")], alignment="center", spacing=10),
+            content=self.wrapped_btn_label,
             bgcolor="tertiary", color="onTertiary", style=ft.ButtonStyle(shape=ft.RoundedRectangleBorder(radius=10)), height=40, visible=False, on_click=self.start_wrapped_generation
         )
         self.btn_edit_tabs = ft.IconButton(icon="edit", tooltip="Edit Visible Tabs", icon_size=20, visible=False, on_click=self.open_tab_editor)
@@ -737,6 +1036,7 @@ class TunesBackApp:
         self.txt_loading_status = ft.Text("Crunching numbers...", size=16, weight="bold", color=Theme.SUBTEXT)
 
     def _init_modals(self):
+        self.modal_container: Optional[ft.Container] = None  # Error dialog, built on first use by _ensure_error_modal_built
         self.tab_editor_col = ft.Column()
         self.tab_editor_modal = ft.Container(
             content=ft.Container(
@@ -749,18 +1049,6 @@ class TunesBackApp:
             ), bgcolor=ft.Colors.with_opacity(0.6, "black"), alignment=ft.alignment.center, visible=False, expand=True
         )
 
-        self.modal_title = ft.Text("Error", weight="bold", size=20)
-        self.modal_text = ft.Text("Msg")
-        self.modal_container = ft.Container(
-            content=ft.Container(
-                content=ft.Column([
-                    self.modal_title, self.modal_text,
-                    ft.Row([ft.TextButton("OK", on_click=lambda e: self.toggle_modal(False))], alignment="end")
-                ], spacing=10, tight=True),
-                padding=25, bgcolor="surface", border_radius=12, width=350, shadow=ft.BoxShadow(blur_radius=20, color=ft.Colors.with_opacity(0.5, "black"))
-            ), bgcolor=ft.Colors.with_opacity(0.6, "black"), alignment=ft.alignment.center, visible=False, expand=True
-        )
-        
         self.wrapped_grid = ft.Row(scroll="auto", expand=True, spacing=30) 
         self.wrapped_modal = ft.Container(
              content=ft.Container(
@@ -794,25 +1082,7 @@ class TunesBackApp:
             alignment=ft.alignment.center, expand=True, visible=False, padding=ft.padding.only(bottom=60)
         )
 
-        kpi_row = ft.Row([
-            create_kpi_card(ft.Column([ft.Text("Top Artist", size=10, color=Theme.SUBTEXT), self.card_vals[0], self.card_subs[0]], horizontal_alignment="center", alignment=ft.MainAxisAlignment.CENTER, spacing=2)),
-            create_kpi_card(ft.Column([ft.Text("Top Album", size=10, color=Theme.SUBTEXT), self.card_vals[1], self.card_subs[1]], horizontal_alignment="center", alignment=ft.MainAxisAlignment.CENTER, spacing=2)),
-            create_kpi_card(ft.Column([ft.Text("Top Song", size=10, color=Theme.SUBTEXT), self.card_vals[2], self.card_subs[2]], horizontal_alignment="center", alignment=ft.MainAxisAlignment.CENTER, spacing=2)),
-        ], spacing=15, expand=True)
-
-        header_row = ft.Row([
-            ft.Container(content=ft.Column([ft.Column([self.kpi_growth, self.kpi_growth_u], spacing=0), ft.Column([self.kpi_plays, self.kpi_plays_u], spacing=0)], alignment="spaceBetween", spacing=0), height=Theme.KPI_HEIGHT, alignment=ft.alignment.center_left),
-            ft.Container(width=40), kpi_row
-        ], alignment="start", vertical_alignment="center")
-
-        self.view_dash = ft.Column([
-            ft.Container(padding=ft.padding.only(left=Theme.PAD_LEFT, right=Theme.PAD_RIGHT), 
-                         content=ft.Column([ft.Container(height=10), header_row, ft.Container(height=20), 
-                                            ft.Row([ft.Row([self.tabs_row, self.btn_edit_tabs], spacing=5, expand=True), self.btn_wrapped], alignment="spaceBetween", vertical_alignment="center"), 
-                                            ft.Container(height=10)])),
-            ft.Container(padding=ft.padding.only(left=Theme.PAD_LEFT, right=Theme.PAD_RIGHT, bottom=10), 
-                         content=ft.Container(content=self.list_results, bgcolor=ft.Colors.with_opacity(0.05, "black"), border_radius=10, border=ft.border.all(1, "outlineVariant"), expand=True), expand=True)
-        ], expand=True, visible=False, spacing=0)
+        self.view_dash: Optional[ft.Column] = None  # Built on the first analysis by _ensure_dashboard_built
 
         self.exp_sliders = ft.Container(
             border=ft.border.all(1, Theme.SUBTEXT), border_radius=10, opacity=0.5,
@@ -844,10 +1114,52 @@ class TunesBackApp:
             padding=ft.padding.only(left=Theme.PAD_LEFT, right=20, top=30 if IS_MACOS else 20, bottom=10), bgcolor=Theme.CONTENT_BG
         ))
 
-        self.main_layout = ft.Container(content=ft.Stack([
-            ft.Row([sidebar, ft.Container(content=ft.Column([window_header, ft.Container(expand=True, bgcolor=Theme.CONTENT_BG, padding=0, content=ft.Column([ft.Stack([self.view_welcome, self.view_dash, self.view_loading], expand=True)], spacing=0))], spacing=0), expand=True)], expand=True, spacing=0, vertical_alignment="stretch"),
-            self.modal_container, self.wrapped_modal, self.tab_editor_modal
-        ]), expand=True)
+        self.content_stack = ft.Stack([self.view_welcome, self.view_loading], expand=True)
+        self.overlay_stack = ft.Stack([
+            ft.Row([sidebar, ft.Container(content=ft.Column([window_header, ft.Container(expand=True, bgcolor=Theme.CONTENT_BG, padding=0, content=ft.Column([self.content_stack], spacing=0))], spacing=0), expand=True)], expand=True, spacing=0, vertical_alignment="stretch"),
+            self.wrapped_modal, self.tab_editor_modal
+        ])
+        self.main_layout = ft.Container(content=self.overlay_stack, expand=True)
+
+    def _ensure_dashboard_built(self):
+        """Builds the results dashboard the first time an analysis starts; most of it is never seen before then."""
+        if self.view_dash is not None: return
+        kpi_row = ft.Row([
+            create_kpi_card(ft.Column([ft.Text("Top Artist", size=10, color=Theme.SUBTEXT), self.card_vals[0], self.card_subs[0]], horizontal_alignment="center", alignment=ft.MainAxisAlignment.CENTER, spacing=2)),
+            create_kpi_card(ft.Column([ft.Text("Top Album", size=10, color=Theme.SUBTEXT), self.card_vals[1], self.card_subs[1]], horizontal_alignment="center", alignment=ft.MainAxisAlignment.CENTER, spacing=2)),
+            create_kpi_card(ft.Column([ft.Text("Top Song", size=10, color=Theme.SUBTEXT), self.card_vals[2], self.card_subs[2]], horizontal_alignment="center", alignment=ft.MainAxisAlignment.CENTER, spacing=2)),
+        ], spacing=15, expand=True)
+
+        header_row = ft.Row([
+            ft.Container(content=ft.Column([ft.Column([self.kpi_growth, self.kpi_growth_u], spacing=0), ft.Column([self.kpi_plays, self.kpi_plays_u], spacing=0)], alignment="spaceBetween", spacing=0), height=Theme.KPI_HEIGHT, alignment=ft.alignment.center_left),
+            ft.Container(width=40), kpi_row
+        ], alignment="start", vertical_alignment="center")
+
+        self.view_dash = ft.Column([
+            ft.Container(padding=ft.padding.only(left=Theme.PAD_LEFT, right=Theme.PAD_RIGHT), 
+                         content=ft.Column([ft.Container(height=10), header_row, ft.Container(height=20), 
+                                            ft.Row([ft.Row([self.tabs_row, self.btn_edit_tabs], spacing=5, expand=True), self.btn_wrapped], alignment="spaceBetween", vertical_alignment="center"), 
+                                            ft.Container(height=10)])),
+            ft.Container(padding=ft.padding.only(left=Theme.PAD_LEFT, right=Theme.PAD_RIGHT, bottom=10), 
+                         content=ft.Container(content=self.list_results, bgcolor=ft.Colors.with_opacity(0.05, "black"), border_radius=10, border=ft.border.all(1, "outlineVariant"), expand=True), expand=True)
+        ], expand=True, visible=False, spacing=0)
+        self.content_stack.controls.insert(1, self.view_dash)  # Between welcome and the loading overlay
+        self.content_stack.update()  # Attach it now so its controls can be updated individually
+
+    def _ensure_error_modal_built(self):
+        if self.modal_container is not None: return
+        self.modal_title = ft.Text("Error", weight="bold", size=20)
+        self.modal_text = ft.Text("Msg")
+        self.modal_container = ft.Container(
+            content=ft.Container(
+                content=ft.Column([
+                    self.modal_title, self.modal_text,
+                    ft.Row([ft.TextButton("OK", on_click=lambda e: self.toggle_modal(False))], alignment="end")
+                ], spacing=10, tight=True),
+                padding=25, bgcolor="surface", border_radius=12, width=350, shadow=ft.BoxShadow(blur_radius=20, color=ft.Colors.with_opacity(0.5, "black"))
+            ), bgcolor=ft.Colors.with_opacity(0.6, "black"), alignment=ft.alignment.center, visible=False, expand=True
+        )
+        self.overlay_stack.controls.insert(1, self.modal_container)  # Below the Wrapped and tab editor modals
 
     # --- TAB LOGIC REGION ---
 
@@ -855,17 +1167,32 @@ class TunesBackApp:
         is_selected = (self.current_tab == key)
         style = ft.ButtonStyle(shape=ft.StadiumBorder())
         btn_cls = ft.FilledButton if is_selected else ft.OutlinedButton
-        return ft.Container(content=btn_cls(text=label, icon=icon, style=style, on_click=lambda e: self.on_custom_tab_clicked(key)), padding=ft.padding.only(right=10))
+        return btn_cls(text=label, icon=icon, style=style, on_click=lambda e: self.on_custom_tab_clicked(key))
+
+    def _refresh_tab_button(self, key):
+        """Creates the cached tab container on first use and swaps its button only when selection changed."""
+        container = self._tab_button_cache.get(key)
+        if container is None:
+            container = ft.Container(padding=ft.padding.only(right=10))
+            self._tab_button_cache[key] = container
+        elif isinstance(container.content, ft.FilledButton) == (self.current_tab == key):
+            return container
+        _, label, icon = next(t for t in self.all_tabs_config if t[0] == key)
+        container.content = self._create_custom_tab_button(key, label, icon)
+        return container
 
     def _render_tabs(self):
         visible_tab_configs = [t for t in self.all_tabs_config if t[0] in self.visible_tabs]
-        self.tabs_row.controls = [self._create_custom_tab_button(k, l, i) for k, l, i in visible_tab_configs]
         if self.current_tab not in self.visible_tabs and visible_tab_configs:
             self.current_tab = visible_tab_configs[0][0]
+        self.tabs_row.controls = [self._refresh_tab_button(k) for k, _, _ in visible_tab_configs]
 
     def on_custom_tab_clicked(self, key):
+        if key == self.current_tab: return
+        prev = self.current_tab
         self.current_tab = key
-        self._render_tabs()
+        self._refresh_tab_button(prev)
+        self._refresh_tab_button(key)
         self.tabs_row.update()
         self.update_results_ui(None)
 
@@ -897,6 +1224,8 @@ class TunesBackApp:
         self.toggle_tab_editor(False)
 
     def toggle_modal(self, show: bool, title: str = "", msg: str = ""):
+        if show: self._ensure_error_modal_built()
+        elif self.modal_container is None: return
         self.modal_container.visible = show
         self.modal_title.value = title
         self.modal_text.value = msg
@@ -942,12 +1271,15 @@ class TunesBackApp:
         self.txt_path.visible = True
         self.txt_file_count.visible = True
         self.files = get_xml_files_in_folder(e.path)
+        self._files_by_label = {f['label']: f for f in self.files}
         
         if self.files:
             self.full_labels = [f['label'] for f in self.files]
             opts = [ft.dropdown.Option(lbl) for lbl in self.full_labels]
             self.dd_start.options = opts
-            self.dd_end.options = [ft.dropdown.Option(lbl) for lbl in self.full_labels]
+            # dd_end is re-filtered on every start change; reuse its Option controls rather than rebuilding them
+            self._end_opt_cache = {lbl: ft.dropdown.Option(lbl) for lbl in self.full_labels}
+            self.dd_end.options = list(self._end_opt_cache.values())
             self.dd_start.value = opts[0].key
             self.dd_end.value = opts[-1].key if len(opts) > 1 else None
             
@@ -962,7 +1294,7 @@ class TunesBackApp:
             
             for c in [self.dd_start, self.btn_run, self.sl_art, self.sl_alb, self.sl_song, self.sl_gen, self.sl_year, self.seg_unit, self.seg_sort, self.cb_album_art]:
                 c.disabled = False
-            self.on_start_changed(None)
+            self.on_start_changed(None, defer_update=True)  # page.update() below pushes dd_end
         else:
             self.txt_path.value = "No dated XML files found."
             self.txt_path.color = "error"
@@ -984,16 +1316,16 @@ class TunesBackApp:
             
         self.page.update()
 
-    def on_start_changed(self, e):
+    def on_start_changed(self, e, defer_update: bool = False):
         if not self.full_labels: return
-        new_end_opts = [ft.dropdown.Option(lbl) for lbl in self.full_labels if lbl != self.dd_start.value]
+        new_end_opts = [self._end_opt_cache[lbl] for lbl in self.full_labels if lbl != self.dd_start.value]
         self.dd_end.options = new_end_opts
         if self.cb_compare.value and new_end_opts and (not self.dd_end.value or self.dd_end.value == self.dd_start.value):
             self.dd_end.value = new_end_opts[-1].key
-        self.dd_end.update()
+        if not defer_update: self.dd_end.update()
 
     def on_unit_changed(self, e):
-        if self.lib_start: self._calculate_and_refresh()
+        if self.lib_start: self._rescale_unit(next(iter(self.seg_unit.selected)))
 
     def toggle_theme(self, e):
         self.page.theme_mode = 'light' if self.page.theme_mode == 'dark' else 'dark'
@@ -1003,14 +1335,17 @@ class TunesBackApp:
     def reset_view(self, e):
         logging.info("Resetting view state.")
         self.view_welcome.visible = True
-        self.view_dash.visible = False
+        if self.view_dash is not None: self.view_dash.visible = False
         self.btn_reset.disabled = True
         self.txt_app_title.opacity = 0
         self.data_frames = {k: pd.DataFrame() for k in ["art", "alb", "song", "gen", "new", "skip", "year"]}
+        self._new_run()  # Stops any artwork still streaming in from the last run
         self.cached_sorted.clear()
         self.art_cache.clear()
         self.lib_start = None
         self.lib_end = None
+        self._parsed_libs.clear()
+        self._last_ui_sig = None
         self.page.update()
 
     # --- ANALYSIS LOGIC REGION ---
@@ -1018,46 +1353,83 @@ class TunesBackApp:
     def cancel_analysis_handler(self, e):
         self.cancel_analysis = True
         logging.warning("Analysis cancellation requested by user.")
-        self.txt_loading_status.value = "Cancelling..."
-        self.page.update()
+        self._set_status("Cancelling...")
 
     def run_analysis(self, e):
         if not self.dd_start.value: return
         
         # Set default visible tabs based on analysis mode
         self.visible_tabs = {"song", "alb", "art", "new"} if self.cb_compare.value else {"song", "alb", "art", "gen"}
+        self._ensure_dashboard_built()
         self._render_tabs()
         self.tabs_row.update()
 
         configure_dynamic_logging(self.cb_logging.value, mode='w')
         
-        try:
-            start_file = next(f for f in self.files if f['label'] == self.dd_start.value)
-            if self.cb_compare.value:
-                if not self.dd_end.value: return
-                end_file = next(f for f in self.files if f['label'] == self.dd_end.value)
-                if start_file['date'] > end_file['date']:
-                    self.toggle_modal(True, "Invalid Range", "Start Date cannot be after End Date.")
-                    return
-        except StopIteration:
+        start_file = self._files_by_label.get(self.dd_start.value)
+        if not start_file:
             self.toggle_modal(True, "Error", "Selected file not found.")
             return
+        if self.cb_compare.value:
+            if not self.dd_end.value: return
+            end_file = self._files_by_label.get(self.dd_end.value)
+            if not end_file:
+                self.toggle_modal(True, "Error", "Selected file not found.")
+                return
+            if start_file['date'] > end_file['date']:
+                self.toggle_modal(True, "Invalid Range", "Start Date cannot be after End Date.")
+                return
 
         logging.info("Starting Analysis Thread.")
         self.cancel_analysis = False
-        self.analysis_thread = threading.Thread(target=self._run_analysis_thread, daemon=True)
+        # A previous run may still be streaming artwork in; it notices the new id and stops on its own
+        self.analysis_thread = threading.Thread(target=self._run_analysis_thread, args=(self._new_run(),), daemon=True)
         self.analysis_thread.start()
 
-    def _run_analysis_thread(self):
+    def _new_run(self) -> int:
+        """Invalidates background work from the previous run and returns the id for the next one."""
+        with self._art_lock:
+            self._run_id += 1
+            self._art_loading = False
+            self._art_slots.clear()
+            return self._run_id
+
+    def _run_superseded(self, run_id: int) -> bool:
+        return self.cancel_analysis or run_id != self._run_id
+
+    def _load_library(self, path: str) -> LibraryData:
+        """Parses a snapshot, reusing the one already in memory when the file is unchanged since."""
+        try:
+            sig = _xml_signature(path)
+        except OSError:
+            sig = None
+        hit = self._parsed_libs.pop(path, None)
+        if hit and sig and hit[0] == sig:
+            logging.info(f"Reusing parsed library: {path}")
+            data = hit[1]
+        else:
+            data = LibraryAnalytics.parse_xml(path)
+            if data.error or not sig: return data
+        self._parsed_libs[path] = (sig, data)  # Re-inserted so it counts as most recently used
+        while len(self._parsed_libs) > PARSED_LIBS_KEPT:
+            del self._parsed_libs[next(iter(self._parsed_libs))]
+        return data
+
+    def _set_status(self, msg: str):
+        """Updates only the loading status text rather than diffing the whole page."""
+        self.txt_loading_status.value = msg
+        self.txt_loading_status.update()
+
+    def _run_analysis_thread(self, run_id: int):
         try:
-            start_file = next(f for f in self.files if f['label'] == self.dd_start.value)
+            start_file = self._files_by_label[self.dd_start.value]
             
-            self._set_loading_state(True)
+            # Set before entering the loading state so its page update carries the text too
             self.txt_loading_status.value = "Parsing first library..."
-            self.page.update()
+            self._set_loading_state(True)
             
             logging.info(f"Parsing main library: {start_file['path']}")
-            self.lib_start = LibraryAnalytics.parse_xml(start_file['path'])
+            self.lib_start = self._load_library(start_file['path'])
             if self.lib_start.error: raise Exception(self.lib_start.error)
             if self.cancel_analysis: return self._set_loading_state(False)
 
@@ -1065,27 +1437,24 @@ class TunesBackApp:
             self.lib_end = None
 
             if self.is_compare_mode:
-                end_file = next(f for f in self.files if f['label'] == self.dd_end.value)
-                self.txt_loading_status.value = "Parsing second library..."
-                self.page.update()
+                end_file = self._files_by_label[self.dd_end.value]
+                self._set_status("Parsing second library...")
                 
                 logging.info(f"Parsing comparison library: {end_file['path']}")
-                self.lib_end = LibraryAnalytics.parse_xml(end_file['path'])
+                self.lib_end = self._load_library(end_file['path'])
                 if self.lib_end.error: raise Exception(self.lib_end.error)
                 if self.cancel_analysis: return self._set_loading_state(False)
                 
-                self.txt_loading_status.value = "Calculating differences..."
+                self._set_status("Calculating differences...")
             else:
-                self.txt_loading_status.value = "Calculating stats..."
-            self.page.update()
+                self._set_status("Calculating stats...")
 
             self._calculate_and_refresh()
+            self._set_loading_state(False)
             
+            # Dashboard is already interactive; thumbnails fill in as they decode
             if self.cb_album_art.value:
-                self._preload_artwork()
-                self.update_results_ui(None)
-            
-            self._set_loading_state(False)
+                self._preload_artwork(run_id)
 
         except Exception as ex:
             logging.error(f"Critical Analysis Error: {ex}")
@@ -1094,9 +1463,7 @@ class TunesBackApp:
             self.toggle_modal(True, "Error", str(ex))
             self._set_loading_state(False)
 
-    def _preload_artwork(self):
-        self.txt_loading_status.value = "Pre-loading album artwork..."
-        self.page.update()
+    def _preload_artwork(self, run_id: int):
         logging.info("Starting album art pre-caching...")
         
         unique_locations = set()
@@ -1104,33 +1471,106 @@ class TunesBackApp:
         for key in ["song", "alb", "new", "skip", "art"]:
             if self.data_frames[key].empty: continue
             
-            limit = 10
-            if key == "alb": limit = int(self.sl_alb.value)
-            elif key == "art": limit = int(self.sl_art.value)
-            else: limit = int(self.sl_song.value)
-            
-            df_top = self.data_frames[key].sort_values("Count", ascending=False).head(limit)
+            df_top = self._top_rows(key, "Count").head(int(self._limit_slider(key).value))
             if "Location" in df_top.columns:
                 unique_locations.update(df_top["Location"].dropna().unique())
         
-        cache_count = 0
-        for loc in unique_locations:
-            if self.cancel_analysis: break
-            if loc not in self.art_cache:
-                pil_img = extract_art_from_file(loc)
-                if pil_img:
-                    pil_img.thumbnail((100, 100))
-                    buffered = BytesIO()
-                    pil_img.save(buffered, format="PNG")
-                    self.art_cache[loc] = base64.b64encode(buffered.getvalue()).decode()
-                    cache_count += 1
-        logging.info(f"Pre-caching complete. Cached {cache_count} new images.")
+        pending = [loc for loc in unique_locations if loc not in self.art_cache]
+        cache_count = stored_count = 0
+        store = self._get_thumbnail_store()
+        fresh: List[Tuple[str, str]] = []
+        if pending:
+            with self._art_lock:
+                if self._run_superseded(run_id): return
+                self._art_loading = True
+            self.update_results_ui(None)  # Re-render with placeholders for the pending covers
+            try:
+                with ThreadPoolExecutor(max_workers=min(len(pending), ART_PRELOAD_WORKERS)) as pool:
+                    futures = {pool.submit(self._load_thumbnail, loc, store): loc for loc in pending}
+                    for future in as_completed(futures):
+                        loc, (key, b64, from_store) = futures[future], future.result()
+                        if from_store:
+                            stored_count += 1
+                        elif key:
+                            fresh.append((key, b64 or ""))
+                        with self._art_lock:
+                            # Checked under the lock so _new_run cannot swap the slots out mid-fill
+                            superseded = self._run_superseded(run_id)
+                            if not superseded:
+                                if b64:
+                                    self.art_cache[loc] = b64
+                                    cache_count += 1
+                                self._fill_art_slots(loc, b64)
+                        if superseded:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            break
+            finally:
+                with self._art_lock:
+                    # A newer run or a reset owns the slots now; _new_run already cleared ours
+                    if not self._run_superseded(run_id):
+                        self._art_loading = False
+                        for loc in list(self._art_slots):
+                            self._fill_art_slots(loc, None)
+                if fresh:
+                    store.put_many(fresh)
+        logging.info(f"Pre-caching complete. Cached {cache_count} images, {stored_count} from the on-disk cache.")
+
+    def _get_thumbnail_store(self) -> Optional[ThumbnailStore]:
+        if self._thumb_store is None:
+            try:
+                self._thumb_store = ThumbnailStore(os.path.join(get_cache_dir(), "thumbnails.db"))
+            except (OSError, sqlite3.Error) as ex:
+                logging.warning(f"ThumbnailStore: Disabled, could not open cache: {ex}")
+        return self._thumb_store
+
+    def _fill_art_slots(self, loc: str, b64: Optional[str]):
+        """Swaps the placeholders waiting on loc for its thumbnail, or hides them if it has none. Caller holds _art_lock."""
+        for slot in self._art_slots.pop(loc, ()):
+            if b64:
+                slot.content = ft.Image(src_base64=b64, width=45, height=45, border_radius=slot.border_radius, fit=ft.ImageFit.COVER)
+                slot.bgcolor = None
+            else:
+                slot.visible = False
+            slot.update()
+
+    @staticmethod
+    def _load_thumbnail(loc: str, store: Optional[ThumbnailStore]) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Runs on a preload worker so the path resolution and stat behind the store key happen in parallel.
+        Returns (store key, base64 thumbnail, whether it came from the store).
+        """
+        path = resolve_path(loc)
+        if not path: return None, None, False
+        key = ThumbnailStore.key_for(path) if store else None
+        if key:
+            b64 = store.get(key)
+            if b64 is not None:
+                return key, b64 or None, True
+        try:
+            return key, TunesBackApp._encode_thumbnail(path), False
+        except Exception as ex:
+            # Possibly transient (e.g. a network share hiccup); no key, so it isn't stored as "no art"
+            logging.warning(f"ArtExtraction: Could not build thumbnail for {path}: {ex}")
+            return None, None, False
+
+    @staticmethod
+    def _encode_thumbnail(path: str) -> Optional[str]:
+        pil_img = extract_art_from_path(path, Theme.ART_THUMB_SIZE, raise_errors=True)
+        if not pil_img: return None
+        pil_img.thumbnail(Theme.ART_THUMB_SIZE)
+        buffered = BytesIO()
+        # Covers are opaque photos in practice; keep PNG only when there is real transparency
+        if pil_img.getextrema()[3][0] < 255:
+            pil_img.save(buffered, format="PNG")
+        else:
+            pil_img.convert("RGB").save(buffered, format="JPEG", quality=Theme.ART_THUMB_QUALITY)
+        return base64.b64encode(buffered.getvalue()).decode()
 
     def _calculate_and_refresh(self):
-        start_file = next((f for f in self.files if f['label'] == self.dd_start.value), None)
+        start_file = self._files_by_label.get(self.dd_start.value)
         start_date = start_file['date'] if start_file else None
         end_year = self.files[-1]['date'].year if self.files else 2025
-        unit = list(self.seg_unit.selected)[0]
+        unit = next(iter(self.seg_unit.selected))
         
         stats = LibraryAnalytics.process_stats(
             new_lib=self.lib_start if not self.is_compare_mode else self.lib_end,
@@ -1144,25 +1584,49 @@ class TunesBackApp:
         
         # Map artist images to their best album cover
         if not df_alb.empty and not df_art.empty:
-            best_covers = df_alb.sort_values('Count', ascending=False).drop_duplicates('Artist')
-            cover_map = dict(zip(best_covers['Artist'], best_covers['Location']))
+            best_covers = df_alb.loc[df_alb.groupby('Artist', sort=False)['Count'].idxmax(), ['Artist', 'Location']]
+            cover_map = best_covers.set_index('Artist')['Location']
             df_art['Location'] = df_art['Artist'].map(cover_map).fillna(df_art['Location'])
 
         self.wrapped_data = {"genres": top_genres, "age": age}
         self.data_frames = {"art": df_art, "alb": df_alb, "song": df_song, "gen": df_gen, "new": df_new, "skip": df_skip, "year": df_year}
         self.cached_sorted.clear()
+        # Warm both sort orders so toggling plays/time only picks a cached frame
+        for key, df in self.data_frames.items():
+            if df.empty: continue
+            for sort_col in (('Year',) if key == 'year' else ('Count', 'Value')):
+                self._top_rows(key, sort_col)
         
-        prefix = f"{unit} Growth" if self.is_compare_mode else f"Total {unit}"
-        self.kpi_growth.value = f"{val_main:,.1f}"
-        self.kpi_growth_u.value = prefix
+        self._stats_unit = unit
+        self._val_main = val_main
         self.kpi_plays.value = f"{int(val_plays):,}"
         self.kpi_plays_u.value = "New Plays" if self.is_compare_mode else "Total Plays"
+        self._refresh_time_views(unit)
+
+    def _rescale_unit(self, unit: str):
+        """Converts the time columns already computed to a new unit instead of re-running process_stats."""
+        factor = unit_divisor(self._stats_unit) / unit_divisor(unit)
+        # A positive rescale keeps every sort order, so cached top rows are rescaled rather than rebuilt
+        frames = list(self.data_frames.items()) + [(key, df) for (key, _), df in self.cached_sorted.items()]
+        for key, df in frames:
+            # Skip counts are the only Value column that is not a duration
+            if key != 'skip' and not df.empty:
+                df['Value'] *= factor
+        self._stats_unit = unit
+        self._val_main *= factor
+        self._refresh_time_views(unit)
+
+    def _refresh_time_views(self, unit: str):
+        prefix = f"{unit} Growth" if self.is_compare_mode else f"Total {unit}"
+        self.kpi_growth.value = f"{self._val_main:,.1f}"
+        self.kpi_growth_u.value = prefix
         
         self._update_top_cards(unit)
         self.update_results_ui(None)
         self.page.update()
 
     def _set_loading_state(self, is_loading: bool):
+        self._ensure_dashboard_built()
         self.view_loading.visible = is_loading
         self.view_welcome.visible = False
         self.view_dash.visible = not is_loading and bool(self.data_frames["art"].size)
@@ -1176,27 +1640,42 @@ class TunesBackApp:
         self.txt_app_title.opacity = 0 if is_loading else 1
         self.btn_wrapped.visible = not is_loading
         self.btn_edit_tabs.visible = not is_loading
-        self.btn_wrapped.content = ft.Row([ft.Icon("auto_awesome"), ft.Text("Generate Wrapped Cards")], alignment="center", spacing=10)
+        self.btn_wrapped.content = self.wrapped_btn_label
         
         if not is_loading:
             self.txt_loading_status.value = "Crunching numbers..."
         self.page.update()
 
+    def _limit_slider(self, key: str) -> ft.Slider:
+        return {"art": self.sl_art, "alb": self.sl_alb, "gen": self.sl_gen, "year": self.sl_year}.get(key, self.sl_song)
+
+    def _top_rows(self, key: str, sort_col: str) -> pd.DataFrame:
+        """Top rows of a result frame, deep enough for the slider's maximum, cached per sort column."""
+        cache_key = (key, sort_col)
+        if cache_key not in self.cached_sorted:
+            self.cached_sorted[cache_key] = self.data_frames[key].nlargest(int(self._limit_slider(key).max), sort_col)
+        return self.cached_sorted[cache_key]
+
     def _update_top_cards(self, unit: str):
-        dfs = [self.data_frames["art"], self.data_frames["alb"], self.data_frames["song"]]
-        keys = ["Artist", "Album", "Song"]
-        for i, df in enumerate(dfs):
-            if df.empty:
+        for i, (key, label_col) in enumerate([("art", "Artist"), ("alb", "Album"), ("song", "Song")]):
+            if self.data_frames[key].empty:
                 self.card_vals[i].value = "-"
                 self.card_subs[i].value = "-"
             else:
-                top = df.sort_values('Value', ascending=False).iloc[0]
-                self.card_vals[i].value = top[keys[i]]
+                top = self._top_rows(key, 'Value').iloc[0]
+                self.card_vals[i].value = top[label_col]
                 self.card_subs[i].value = f"{top['Value']:.1f} {unit} • {int(top['Count'])} plays"
 
     def update_results_ui(self, e):
-        unit = list(self.seg_unit.selected)[0]
-        sort_mode = list(self.seg_sort.selected)[0]
+        if self.view_dash is None: return  # Sort changes before the first analysis have nothing to show
+        unit = next(iter(self.seg_unit.selected))
+        sort_mode = next(iter(self.seg_sort.selected))
+        # Control events (e set) are skipped when nothing that feeds the list changed;
+        # internal refreshes pass None because the data or artwork behind them did change
+        sig = (self.current_tab, unit, sort_mode, self.cb_album_art.value,
+               *(int(sl.value) for sl in (self.sl_art, self.sl_alb, self.sl_song, self.sl_gen, self.sl_year)))
+        if e is not None and sig == self._last_ui_sig: return
+        self._last_ui_sig = sig
         
         configs = {
             "art": (self.data_frames["art"], int(self.sl_art.value), "cyan", "Artist", None, False, True),
@@ -1214,29 +1693,39 @@ class TunesBackApp:
             else: return
         
         df, limit, color, main_col, sub_col, is_skip, is_circular = configs.get(self.current_tab, configs["art"])
-        self.list_results.controls.clear()
         
-        if df.empty:
-            self.list_results.controls.append(ft.Text("No data to display.", italic=True))
-        else:
-            cache_key = (self.current_tab, sort_mode)
-            if cache_key not in self.cached_sorted:
+        # Held while rebuilding so the art preload never fills a slot that is being replaced
+        with self._art_lock:
+            self.list_results.controls.clear()
+            self._art_slots.clear()
+            
+            if df.empty:
+                self.list_results.controls.append(ft.Text("No data to display.", italic=True))
+            else:
                 sort_col = 'Value' if sort_mode == 'time' or self.current_tab == 'skip' else 'Count'
                 if self.current_tab == 'year': sort_col = 'Year'
-                self.cached_sorted[cache_key] = df.sort_values(sort_col, ascending=False)
-            
-            df_sorted = self.cached_sorted[cache_key].head(limit)
-            show_art = self.cb_album_art.value and self.current_tab in ["song", "alb", "new", "art"]
-            
-            for i, row in enumerate(df_sorted.itertuples(), 1):
-                lbl = getattr(row, main_col)
-                sub = getattr(row, sub_col) if sub_col else ""
-                art_b64 = self.art_cache.get(getattr(row, "Location", None)) if show_art else None
-
-                self.list_results.controls.append(
-                    draw_list_item(i, lbl, sub, getattr(row, "Value"), getattr(row, "Count"), unit, color, is_skip, art_src_b64=art_b64, is_circular=is_circular)
+                df_sorted = self._top_rows(self.current_tab, sort_col).head(limit)
+                show_art = self.cb_album_art.value and self.current_tab in ["song", "alb", "new", "art"]
+                
+                n_rows = len(df_sorted)
+                # Whole columns as Python lists; much cheaper than getattr on itertuples rows
+                rows = zip(
+                    df_sorted[main_col].tolist(),
+                    df_sorted[sub_col].tolist() if sub_col else [""] * n_rows,
+                    df_sorted["Value"].tolist(), df_sorted["Count"].tolist(),
+                    df_sorted["Location"].tolist() if "Location" in df_sorted.columns else [None] * n_rows,
                 )
-        self.list_results.update()
+                for i, (lbl, sub, value, count, loc) in enumerate(rows, 1):
+                    art_b64 = self.art_cache.get(loc) if show_art else None
+                    art_slot = None
+                    if show_art and not art_b64 and self._art_loading and pd.notna(loc):
+                        art_slot = ft.Container(width=45, height=45, border_radius=50 if is_circular else 8, bgcolor="surfaceVariant")
+                        self._art_slots.setdefault(loc, []).append(art_slot)
+
+                    self.list_results.controls.append(
+                        draw_list_item(i, lbl, sub, value, count, unit, color, is_skip, art_src_b64=art_b64, is_circular=is_circular, art_slot=art_slot)
+                    )
+            self.list_results.update()
 
     # --- WRAPPED GENERATION REGION ---
 
@@ -1248,26 +1737,31 @@ class TunesBackApp:
 
     def _generate_wrapped_thread(self):
         logging.info("Starting Wrapped Generation...")
-        sort_mode = list(self.seg_sort.selected)[0]
+        sort_mode = next(iter(self.seg_sort.selected))
         sort_col = 'Value' if sort_mode == 'time' else 'Count'
-        current_unit = list(self.seg_unit.selected)[0]
+        current_unit = next(iter(self.seg_unit.selected))
         
         min_multiplier = 60.0 if current_unit == Theme.UNIT_HOURS else (1440.0 if current_unit == Theme.UNIT_DAYS else 1.0)
         
-        top_songs = self.data_frames['song'].sort_values(sort_col, ascending=False).head(5).to_dict('records')
-        top_albums = self.data_frames['alb'].sort_values(sort_col, ascending=False).head(5).to_dict('records')
-        top_artists_list = self.data_frames['art'].sort_values(sort_col, ascending=False).head(5).to_dict('records')
-        top_artists = self.data_frames['art'].sort_values(sort_col, ascending=False).head(1).to_dict('records')
+        def top5(key):
+            if self.data_frames[key].empty: return []
+            return list(self._top_rows(key, sort_col).head(5).itertuples(index=False))
+
+        top_songs, top_albums, top_artists_list = top5('song'), top5('alb'), top5('art')
         
         total_minutes = int(self.data_frames['song']['Value'].sum() * min_multiplier)
 
+        # Artist covers are borrowed from their top album, so the same file often backs several cards
+        art_by_path: Dict[Any, Optional[Image.Image]] = {}
         def get_pil_art(path):
-            return extract_art_from_file(path)
+            if path not in art_by_path:
+                art_by_path[path] = extract_art_from_file(path, Theme.ART_WRAPPED_SIZE)
+            return art_by_path[path]
 
         wrapped_context = {
-            'top_songs': [{'name': s['Song'], 'sub': s['Artist'], 'image': get_pil_art(s.get('Location')), 'count': s['Count']} for s in top_songs],
-            'top_albums': [{'name': a['Album'], 'sub': a['Artist'], 'image': get_pil_art(a.get('Location')), 'minutes': int(a['Value'] * min_multiplier)} for a in top_albums],
-            'top_artists_list': [{'name': a['Artist'], 'image': get_pil_art(a.get('Location'))} for a in top_artists_list],
+            'top_songs': [{'name': s.Song, 'sub': s.Artist, 'image': get_pil_art(s.Location), 'count': s.Count} for s in top_songs],
+            'top_albums': [{'name': a.Album, 'sub': a.Artist, 'image': get_pil_art(a.Location), 'minutes': int(a.Value * min_multiplier)} for a in top_albums],
+            'top_artists_list': [{'name': a.Artist, 'image': get_pil_art(a.Location)} for a in top_artists_list],
             'genres': self.wrapped_data.get('genres', []),
             'total_minutes': total_minutes
         }
@@ -1284,12 +1778,13 @@ class TunesBackApp:
             'label': f"During {start_label} to {end_label}"
         }
 
-        if top_artists:
-            ta = top_artists[0]
+        if top_artists_list:
+            ta = top_artists_list[0]
             wrapped_context['top_artist'] = {
-                'name': ta['Artist'], 
-                'minutes': int(ta['Value'] * min_multiplier), 
-                'image': get_pil_art(ta.get('Location'))
+                'name': ta.Artist, 
+                'minutes': int(ta.Value * min_multiplier), 
+                # Same artist as the first list entry; the card renderer only reads images, so share the decode
+                'image': wrapped_context['top_artists_list'][0]['image']
             }
 
         logging.info("Context prepared. Invoking generator...")
@@ -1299,15 +1794,23 @@ class TunesBackApp:
         logging.info("Wrapped Generation Complete.")
         self._show_wrapped_ui()
 
+    @staticmethod
+    def _encode_preview(img: Image.Image) -> str:
+        buffered = BytesIO()
+        img.convert("RGB").save(buffered, format="JPEG", quality=Theme.WRAPPED_PREVIEW_QUALITY)
+        return base64.b64encode(buffered.getbuffer()).decode()
+
     def _show_wrapped_ui(self):
         self.selected_indices.clear()
         controls = []
         
-        for i, img in enumerate(self.generated_images):
-            buffered = BytesIO()
-            img.convert("RGB").save(buffered, format="JPEG", quality=100)
-            b64_str = base64.b64encode(buffered.getvalue()).decode()
-            
+        b64_strs = []
+        if self.generated_images:
+            # Pillow releases the GIL while encoding, so cards encode side by side
+            with ThreadPoolExecutor(max_workers=min(len(self.generated_images), os.cpu_count() or 1)) as pool:
+                b64_strs = list(pool.map(self._encode_preview, self.generated_images))
+        
+        for i, b64_str in enumerate(b64_strs):
             def on_check(e, idx=i):
                 if e.control.value: self.selected_indices.add(idx)
                 else: self.selected_indices.discard(idx)
@@ -1318,7 +1821,7 @@ class TunesBackApp:
             ], horizontal_alignment="center", spacing=5))
         
         self.wrapped_grid.controls = controls
-        self.btn_wrapped.content = ft.Row([ft.Icon("auto_awesome"), ft.Text("Generate Wrapped Cards")], alignment="center", spacing=10)
+        self.btn_wrapped.content = self.wrapped_btn_label
         self.btn_wrapped.update()
         self.toggle_wrapped_modal(True)
 